@@ -373,6 +373,8 @@ class AttendanceStateManager:
         
         return {
             'date': state.get('date'),
+            'signin_completed': bool(state.get('signin_completed')),
+            'signout_completed': bool(state.get('signout_completed')),
             'signin_status': signin_status,
             'signout_status': signout_status,
             'signin_time': state.get('signin_time'),
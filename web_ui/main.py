@@ -9,13 +9,16 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
+import asyncio
 from pathlib import Path
 from datetime import datetime
 
 from src.app_utils import ConfigManager
+from src.json_io import FastJSONResponse
 from src.logging_config import setup_logging
-from src.dashboard.routes import router as dashboard_router
+from src.dashboard.routes import router as dashboard_router, dashboard_lifespan
 from src.service.routes import router as service_router
 from src.activities.routes import router as activities_router
 from src.logs.routes import router as logs_router
@@ -34,7 +37,9 @@ app = FastAPI(
     description="Web UI for monitoring and managing GreytHR attendance automation",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
+    lifespan=dashboard_lifespan
 )
 
 # Add CORS middleware
@@ -46,6 +51,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large payloads (log listings are highly repetitive); GZip flushes per
+# body chunk, so NDJSON streams stay incremental
+app.add_middleware(GZipMiddleware, minimum_size=4096)
+
 # Include routers
 app.include_router(dashboard_router)
 app.include_router(service_router)
@@ -80,9 +89,15 @@ async def api_health_check():
         greythr_path = Path(config.get("greythr", {}).get("project_path", "../"))
         state_file = greythr_path / "state" / "current_state.json"
         
+        # Run the filesystem checks off the event loop and concurrently
+        project_exists, state_exists = await asyncio.gather(
+            asyncio.to_thread(greythr_path.exists),
+            asyncio.to_thread(state_file.exists)
+        )
+        
         checks = {
-            "greythr_project_accessible": greythr_path.exists(),
-            "state_file_exists": state_file.exists(),
+            "greythr_project_accessible": project_exists,
+            "state_file_exists": state_exists,
             "config_loaded": bool(config)
         }
         
@@ -130,6 +145,9 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         }
     )
 
+# Build the OpenAPI schema once all routes are registered, instead of on the first /docs hit
+app.openapi()
+
 if __name__ == "__main__":
     # Load server configuration
     host = config.get("server", {}).get("host", "127.0.0.1")
@@ -139,9 +157,18 @@ if __name__ == "__main__":
     logger.info(f"Dashboard: http://{host}:{port}")
     logger.info(f"API Docs: http://{host}:{port}/docs")
     
+    # Prefer uvloop (installed with uvicorn[standard]); fall back to the stdlib loop
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    logger.info(f"Event loop: {loop}")
+    
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
+        loop=loop,
         log_level="info"
     )
@@ -0,0 +1,47 @@
+#!/bin/bash
+# Production server runner for GreytHR Web UI Dashboard (gunicorn + uvicorn workers)
+
+set -e
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+echo -e "${BLUE}🚀 Starting GreytHR Web UI Dashboard - Production Server${NC}"
+echo -e "${BLUE}=========================================================${NC}"
+
+# Set environment variables
+export CONFIG_PATH="conf"
+export PYTHONPATH="${PYTHONPATH}:$(pwd)"
+
+# Activate virtual environment
+if [[ ! -d ".venv" ]]; then
+    echo -e "${RED}❌ Virtual environment not found. Run ./scripts/setup.sh first${NC}"
+    exit 1
+fi
+source .venv/bin/activate
+
+# Create logs directory if it doesn't exist
+mkdir -p logs
+
+# Worker count: 2 x cores + 1 unless overridden (nproc on Linux, sysctl on macOS)
+CORES=$(nproc 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 1)
+WORKERS="${WEB_WORKERS:-$((CORES * 2 + 1))}"
+BIND="${WEB_BIND:-127.0.0.1:8000}"
+
+echo -e "${GREEN}📍 Dashboard: http://${BIND}${NC}"
+echo -e "${GREEN}⚙️  Workers: ${WORKERS}${NC}"
+echo -e "${YELLOW}   Caches are per worker process; set WEB_WORKERS=1 to share one cache${NC}"
+echo ""
+
+# Each worker runs its own event loop (uvloop when installed)
+exec gunicorn main:app \
+    --workers "$WORKERS" \
+    --worker-class uvicorn.workers.UvicornWorker \
+    --bind "$BIND" \
+    --graceful-timeout 30 \
+    --timeout 60 \
+    --access-logfile -
@@ -46,7 +46,7 @@ if [[ -f "requirements.txt" ]]; then
     echo -e "${GREEN}✅ Dependencies installed${NC}"
 else
     echo -e "${YELLOW}⚠️  requirements.txt not found, installing basic dependencies...${NC}"
-    pip install fastapi uvicorn jinja2 aiofiles pyyaml
+    pip install fastapi "uvicorn[standard]" jinja2 aiofiles pyyaml
 fi
 
 # Create necessary directories
@@ -5,13 +5,20 @@ Configuration management and helper functions
 
 import yaml
 import logging
+import asyncio
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
 import os
-from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 class ConfigManager:
     """Configuration manager following the established pattern"""
     
@@ -29,7 +36,7 @@ class ConfigManager:
             
         try:
             with open(config_file, 'r') as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=YamlLoader) or {}
             logger.info(f"Loaded YAML config from {config_file}")
             return config
         except Exception as e:
@@ -163,17 +170,57 @@ class GreytHRIntegration:
         """Get path to service management script"""
         return self.project_path / "greythr_service.sh"
 
-@lru_cache()
-def get_config_manager() -> ConfigManager:
-    """Get singleton ConfigManager instance"""
-    return ConfigManager()
-
-@lru_cache()
-def get_greythr_integration() -> GreytHRIntegration:
-    """Get singleton GreytHRIntegration instance"""
-    config = get_config_manager().load_config()
-    project_path = config.get("greythr", {}).get("project_path", "../")
-    return GreytHRIntegration(project_path)
+class TTLCache:
+    """In-process TTL cache for async loaders with per-key request coalescing"""
+    
+    def __init__(self, ttl: float = 30.0):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    def _get_fresh(self, key: str, ttl: float) -> Tuple[bool, Any]:
+        """Return (hit, value) for a key that has not expired"""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return True, entry[1]
+        return False, None
+    
+    def get(self, key: str, ttl: Optional[float] = None) -> Tuple[bool, Any]:
+        """Return (hit, value) for key without loading on a miss"""
+        return self._get_fresh(key, self.ttl if ttl is None else ttl)
+    
+    def set(self, key: str, value: Any):
+        """Store a value for key, restarting its TTL"""
+        self._entries[key] = (time.monotonic(), value)
+    
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]],
+                          ttl: Optional[float] = None) -> Any:
+        """Return the cached value for key, calling loader on a miss"""
+        ttl = self.ttl if ttl is None else ttl
+        hit, value = self._get_fresh(key, ttl)
+        if hit:
+            return value
+        
+        # Only one coroutine loads a given key; concurrent callers wait for it
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            hit, value = self._get_fresh(key, ttl)
+            if hit:
+                return value
+            value = await loader()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+    
+    def keys(self) -> List[str]:
+        """Get the currently stored keys (fresh or not)"""
+        return list(self._entries)
+    
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one key, or the whole cache when no key is given"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
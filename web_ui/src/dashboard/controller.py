@@ -3,37 +3,78 @@ Dashboard controller
 Business logic layer for dashboard operations
 """
 
+import asyncio
+import heapq
 import logging
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Optional, List, AsyncIterator, Callable
 from datetime import datetime
 from pathlib import Path
 
 from .repository import DashboardRepository
+from ..app_utils import TTLCache
 from .schemas import DashboardOverview, QuickStats, Alert
 from ..models.status import SystemStatusResponse, TodaySummaryResponse
 from ..models.activity import ActivityListItem
 
 logger = logging.getLogger('webui.dashboard.controller')
 
+# Alert priority: error > warning > info > success (unknown types sort last)
+_ALERT_PRIORITY = MappingProxyType({"error": 1, "warning": 2, "info": 3, "success": 4})
+
 class DashboardController:
     """Controller for dashboard business logic"""
     
-    def __init__(self, repository: DashboardRepository):
+    def __init__(self, repository: DashboardRepository, cache: Optional[TTLCache] = None):
         self.repository = repository
+        self.cache = cache
+    
+    async def _cached(self, key: str, loader):
+        """Serve loader() through the TTL cache when one is configured"""
+        if self.cache is None:
+            return await loader()
+        return await self.cache.get_or_load(key, loader)
         
+    def invalidate_cache(self):
+        """Drop cached dashboard data so the next request reloads it"""
+        if self.cache is not None:
+            self.cache.invalidate()
+        self.repository.invalidate_rolling_stats()
+    
+    async def watch_for_changes(self, on_change: Callable[[], None], interval: float = 2.0):
+        """Invalidate cached data whenever the daemon writes state or activity files"""
+        last_fingerprint = None
+        while True:
+            try:
+                fingerprint = await self.repository.get_data_fingerprint()
+                if last_fingerprint is not None and fingerprint != last_fingerprint:
+                    logger.debug("Dashboard data changed on disk, dropping cached data")
+                    self.invalidate_cache()
+                    on_change()
+                last_fingerprint = fingerprint
+            except Exception as e:
+                logger.error(f"Error watching dashboard data for changes: {e}")
+            await asyncio.sleep(interval)
+    
     async def get_dashboard_overview(self) -> DashboardOverview:
         """Get complete dashboard overview with all components"""
+        return await self._cached("overview", self._build_dashboard_overview)
+    
+    async def _build_dashboard_overview(self) -> DashboardOverview:
+        """Assemble the dashboard overview from its components"""
         try:
             logger.info("Fetching dashboard overview")
             
+            # Parse the state file once and share it between the components using it
+            state_data = await self._load_state()
+            
             # Fetch all data concurrently
-            import asyncio
             system_status, today_summary, recent_activities, quick_stats, alerts = await asyncio.gather(
-                self.get_system_status(),
-                self.get_today_summary(),
+                self.get_system_status(state_data),
+                self.get_today_summary(state_data),
                 self.get_recent_activities(),
                 self.get_quick_stats(),
-                self.get_system_alerts(),
+                self.get_system_alerts(state_data),
                 return_exceptions=True
             )
             
@@ -96,10 +137,13 @@ class DashboardController:
                 )]
             )
     
-    async def get_system_status(self) -> SystemStatusResponse:
+    async def get_system_status(self, state_data: Optional[dict] = None) -> SystemStatusResponse:
         """Get current system status with validation"""
         try:
-            status = await self.repository.get_system_status()
+            status = await self._cached(
+                "system_status",
+                lambda: self.repository.get_system_status(state_data)
+            )
             if status is None:
                 logger.warning("No system status available, using fallback")
                 return self.repository._get_fallback_status()
@@ -112,10 +156,21 @@ class DashboardController:
             logger.error(f"Error in get_system_status controller: {e}")
             return self.repository._get_fallback_status()
     
-    async def get_today_summary(self) -> TodaySummaryResponse:
+    async def get_status_projection(self) -> dict:
+        """Get a lightweight system status for frequent polling"""
+        return await self.repository.get_status_projection()
+    
+    async def get_summary_projection(self) -> dict:
+        """Get a lightweight attendance summary for frequent polling"""
+        return await self.repository.get_summary_projection()
+    
+    async def get_today_summary(self, state_data: Optional[dict] = None) -> TodaySummaryResponse:
         """Get today's summary with business logic enhancements"""
         try:
-            summary = await self.repository.get_today_summary()
+            summary = await self._cached(
+                "today_summary",
+                lambda: self.repository.get_today_summary(state_data)
+            )
             if summary is None:
                 logger.warning("No today summary available, using fallback")
                 return self.repository._get_fallback_today_summary()
@@ -131,7 +186,10 @@ class DashboardController:
     async def get_recent_activities(self, limit: int = 5) -> List[ActivityListItem]:
         """Get recent activities with filtering and validation"""
         try:
-            activities = await self.repository.get_recent_activities(limit)
+            activities = await self._cached(
+                f"recent_activities:{limit}",
+                lambda: self.repository.get_recent_activities(limit)
+            )
             
             # Apply business logic filtering
             filtered_activities = self._filter_recent_activities(activities)
@@ -141,10 +199,18 @@ class DashboardController:
             logger.error(f"Error in get_recent_activities controller: {e}")
             return []
     
+    async def iter_recent_activities(self, limit: int = 5) -> AsyncIterator[ActivityListItem]:
+        """Stream recent activities as each day's file is read (newest first)"""
+        try:
+            async for activity in self.repository.iter_recent_activities(limit):
+                yield activity
+        except Exception as e:
+            logger.error(f"Error in iter_recent_activities controller: {e}")
+    
     async def get_quick_stats(self) -> QuickStats:
         """Get quick statistics with business logic calculations"""
         try:
-            stats = await self.repository.get_quick_stats()
+            stats = await self._cached("quick_stats", self.repository.get_quick_stats)
             
             # Apply business logic enhancements
             enhanced_stats = self._enhance_quick_stats(stats)
@@ -161,10 +227,13 @@ class DashboardController:
                 avg_signout_time=None
             )
     
-    async def get_system_alerts(self) -> List[Alert]:
+    async def get_system_alerts(self, state_data: Optional[dict] = None) -> List[Alert]:
         """Get system alerts with prioritization and filtering"""
         try:
-            alerts = await self.repository.get_system_alerts()
+            alerts = await self._cached(
+                "system_alerts",
+                lambda: self.repository.get_system_alerts(state_data)
+            )
             
             # Apply business logic for alert prioritization
             prioritized_alerts = self._prioritize_alerts(alerts)
@@ -183,21 +252,32 @@ class DashboardController:
     
     # Private helper methods for business logic
     
+    async def _load_state(self) -> dict:
+        """Load state data once for a request ({} if unavailable, so callers don't re-read)"""
+        try:
+            return await self.repository.get_state_data() or {}
+        except Exception as e:
+            logger.error(f"Error loading state data: {e}")
+            return {}
+    
     def _validate_system_status(self, status: SystemStatusResponse) -> SystemStatusResponse:
         """Apply business logic validation to system status"""
+        # SystemStatusResponse is frozen, so collect corrections and apply them as a copy
+        updates = {}
+        
         # Validate uptime consistency
         if status.uptime_seconds < 0:
-            status.uptime_seconds = 0
-            status.uptime_formatted = "0s"
+            updates['uptime_seconds'] = 0
+            updates['uptime_formatted'] = "0s"
         
         # Validate resource usage
         if status.memory_usage_mb < 0:
-            status.memory_usage_mb = 0.0
+            updates['memory_usage_mb'] = 0.0
         
         if status.cpu_percent < 0 or status.cpu_percent > 100:
-            status.cpu_percent = 0.0
+            updates['cpu_percent'] = 0.0
         
-        return status
+        return status.model_copy(update=updates) if updates else status
     
     def _enhance_today_summary(self, summary: TodaySummaryResponse) -> TodaySummaryResponse:
         """Apply business logic enhancements to today's summary"""
@@ -212,47 +292,36 @@ class DashboardController:
     
     def _filter_recent_activities(self, activities: List[ActivityListItem]) -> List[ActivityListItem]:
         """Apply filtering to recent activities"""
-        # Sort by date (most recent first)
-        try:
-            activities.sort(key=lambda x: x.date, reverse=True)
-        except Exception:
-            pass
-        
-        return activities
+        # Sort by date (most recent first) into a new list; the input may be a cached one
+        return sorted(activities, key=lambda x: x.date, reverse=True)
     
     def _enhance_quick_stats(self, stats: QuickStats) -> QuickStats:
         """Apply business logic enhancements to quick stats"""
+        # QuickStats is frozen, so collect corrections and apply them as a copy
+        updates = {}
+        
         # Ensure percentages are within valid ranges
         if stats.success_rate < 0:
-            stats.success_rate = 0.0
+            updates['success_rate'] = 0.0
         elif stats.success_rate > 100:
-            stats.success_rate = 100.0
+            updates['success_rate'] = 100.0
         
         # Ensure counts are non-negative
         if stats.current_streak < 0:
-            stats.current_streak = 0
+            updates['current_streak'] = 0
         
         if stats.last_7_days_success < 0:
-            stats.last_7_days_success = 0
+            updates['last_7_days_success'] = 0
         elif stats.last_7_days_success > 7:
-            stats.last_7_days_success = 7
+            updates['last_7_days_success'] = 7
         
-        return stats
+        return stats.model_copy(update=updates) if updates else stats
     
     def _prioritize_alerts(self, alerts: List[Alert]) -> List[Alert]:
         """Prioritize and filter alerts based on business logic"""
-        # Sort by priority: error > warning > info > success
-        priority_map = {"error": 1, "warning": 2, "info": 3, "success": 4}
-        
-        try:
-            alerts.sort(key=lambda x: (
-                priority_map.get(x.type, 5),
-                x.timestamp
-            ))
-        except Exception:
-            pass
+        key = _ALERT_PRIORITY.get
         
-        # Limit to maximum 5 alerts to avoid UI clutter
-        return alerts[:5]
+        # Keep only the 5 highest-priority alerts to avoid UI clutter
+        return heapq.nsmallest(5, alerts, key=lambda x: (key(x.type, 5), x.timestamp))
     
 
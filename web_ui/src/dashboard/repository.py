@@ -4,11 +4,13 @@ Data access layer for dashboard functionality
 """
 
 import logging
+import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple, AsyncIterator
 from datetime import datetime, timedelta
 import json
 import asyncio
+from functools import lru_cache
 
 from ..database.connection import StateRepository, ActivitiesRepository
 from ..models.status import SystemStatus, SystemStatusResponse, TodaySummaryResponse
@@ -18,6 +20,139 @@ from .schemas import QuickStats, Alert, DashboardOverview
 
 logger = logging.getLogger('webui.dashboard.repository')
 
+# ISO 8601 parser: fromisoformat is fast and complete from Python 3.11; on older
+# versions prefer the C-accelerated ciso8601 when it is installed
+_parse_iso = datetime.fromisoformat
+if sys.version_info < (3, 11):
+    try:
+        from ciso8601 import parse_datetime as _parse_iso
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+
+def _empty_rolling_stats() -> Dict[str, Any]:
+    """Get an empty rolling stats aggregate"""
+    return {
+        'last_date': None,
+        'total_days': 0,
+        'successful_days': 0,
+        'current_streak': 0,
+        'recent_results': [],  # newest first, last 7 days
+        'signin_minutes_sum': 0,
+        'signin_count': 0,
+        'signout_minutes_sum': 0,
+        'signout_count': 0
+    }
+
+def _minutes_since_midnight(iso_time: Optional[str]) -> Optional[int]:
+    """Convert an ISO timestamp to minutes since midnight"""
+    if not iso_time:
+        return None
+    
+    # Fast path: canonical 'YYYY-MM-DDTHH:MM...' strings, read at fixed offsets
+    if len(iso_time) >= 16 and iso_time[10] in 'T ' and iso_time[13] == ':':
+        hour, minute = iso_time[11:13], iso_time[14:16]
+        if hour.isdigit() and minute.isdigit():
+            return int(hour) * 60 + int(minute)
+    
+    try:
+        dt = _parse_iso(iso_time)
+    except (TypeError, ValueError):
+        return None
+    return dt.hour * 60 + dt.minute
+
+class _DayStats(NamedTuple):
+    """What one day's activity file contributes to the quick stats"""
+    successful: bool
+    signin_minutes: Optional[int]
+    signout_minutes: Optional[int]
+
+def _summarize_activity(activity_data: Optional[Dict[str, Any]]) -> _DayStats:
+    """Reduce a day's activity to its quick-stats contribution"""
+    activity_data = activity_data or {}
+    successful = bool(
+        activity_data.get('signin_completed', False) and
+        activity_data.get('signout_completed', False)
+    )
+    return _DayStats(
+        successful,
+        _minutes_since_midnight(activity_data.get('signin_time')),
+        _minutes_since_midnight(activity_data.get('signout_time'))
+    )
+
+def _fold_day_into_stats(stats: Dict[str, Any], date: str, day: _DayStats):
+    """Fold one day into the aggregate (days must arrive oldest first)"""
+    stats['last_date'] = date
+    stats['total_days'] += 1
+    if day.successful:
+        stats['successful_days'] += 1
+        stats['current_streak'] += 1
+    else:
+        stats['current_streak'] = 0
+    stats['recent_results'] = ([day.successful] + stats['recent_results'])[:7]
+    
+    for action, minutes in (('signin', day.signin_minutes), ('signout', day.signout_minutes)):
+        if minutes is not None:
+            stats[f'{action}_minutes_sum'] += minutes
+            stats[f'{action}_count'] += 1
+
+def _is_completed(today_summary: Dict[str, Any], action: str) -> bool:
+    """Whether today's sign-in/sign-out is done"""
+    # Prefer the daemon's boolean; older state files only carry the status text
+    completed = today_summary.get(f'{action}_completed')
+    if completed is None:
+        completed = today_summary.get(f'{action}_status', '').startswith('✅')
+    return completed
+
+@lru_cache(maxsize=2048)
+def _format_time_ampm(iso_time: Optional[str]) -> Optional[str]:
+    """Format an ISO timestamp as 'HH:MM AM/PM' (None if missing or invalid)"""
+    if not iso_time:
+        return None
+    try:
+        return _parse_iso(iso_time).strftime('%I:%M %p')
+    except (TypeError, ValueError):
+        return None
+
+def _build_activity_item(date: str, signin_complete: bool, signout_complete: bool,
+                         signin_time: Optional[str], signout_time: Optional[str],
+                         total_attempts: int, has_errors: bool) -> ActivityListItem:
+    """Build a formatted activity list item"""
+    # Determine status
+    if signin_complete and signout_complete:
+        status = "Complete"
+        status_color = "success"
+    elif signin_complete or signout_complete:
+        status = "Partial"
+        status_color = "warning"
+    else:
+        status = "Failed"
+        status_color = "danger"
+    
+    # Format times
+    signin_time_formatted = _format_time_ampm(signin_time)
+    signout_time_formatted = _format_time_ampm(signout_time)
+    
+    # Day of week
+    try:
+        # fromisoformat skips strptime's per-call format parsing and locale lookups
+        day_of_week = _parse_iso(date).strftime('%A')
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Invalid activity date {date!r}: {e}")
+        day_of_week = "Unknown"
+    
+    return ActivityListItem(
+        date=date,
+        day_of_week=day_of_week,
+        signin_completed=signin_complete,
+        signout_completed=signout_complete,
+        signin_time_formatted=signin_time_formatted,
+        signout_time_formatted=signout_time_formatted,
+        status=status,
+        status_color=status_color,
+        total_attempts=total_attempts,
+        has_errors=has_errors
+    )
+
 class DashboardRepository:
     """Repository for dashboard data operations"""
     
@@ -25,11 +160,28 @@ class DashboardRepository:
         self.project_path = Path(project_path)
         self.state_repo = StateRepository(project_path)
         self.activities_repo = ActivitiesRepository(project_path)
+        # Last computed alerts, keyed on the state file mtime
+        self._alerts_cache: Optional[Tuple[int, List[Alert]]] = None
+        # Quick-stats contribution per past day, keyed on its activity file's (mtime_ns, size),
+        # and the aggregate over those days keyed on the activities directory mtime and day
+        # count. Kept in memory: the daemon's directories are only ever read from here.
+        self._day_stats: Dict[str, Tuple[Tuple[int, int], _DayStats]] = {}
+        self._rolling_stats: Optional[Tuple[Tuple[Optional[int], int], Dict[str, Any]]] = None
         
-    async def get_system_status(self) -> Optional[SystemStatusResponse]:
-        """Get current system status"""
+    async def get_state_data(self) -> Optional[Dict[str, Any]]:
+        """Get raw system state data"""
+        return await self.state_repo.get_current_state()
+    
+    async def get_data_fingerprint(self) -> Tuple[Optional[int], ...]:
+        """Get modification times of the files the dashboard is built from"""
+        state_mtime = await self.state_repo.get_state_mtime_ns()
+        return (state_mtime, *await self.activities_repo.get_change_fingerprint())
+    
+    async def get_system_status(self, state_data: Optional[Dict[str, Any]] = None) -> Optional[SystemStatusResponse]:
+        """Get current system status (reads the state file unless state_data is given)"""
         try:
-            state_data = await self.state_repo.get_current_state()
+            if state_data is None:
+                state_data = await self.state_repo.get_current_state()
             if not state_data:
                 logger.warning("No state data available")
                 return self._get_fallback_status()
@@ -50,7 +202,7 @@ class DashboardRepository:
                 uptime_formatted=uptime_formatted,
                 memory_usage_mb=system_info.get('memory_usage_mb', 0.0),
                 cpu_percent=system_info.get('cpu_percent', 0.0),
-                last_updated=state_data.get('last_updated', datetime.now().isoformat()),
+                last_updated=state_data.get('last_updated') or datetime.now().isoformat(),
                 script_pid=script_info.get('pid')
             )
             
@@ -58,10 +210,34 @@ class DashboardRepository:
             logger.error(f"Error getting system status: {e}")
             return self._get_fallback_status()
     
-    async def get_today_summary(self) -> Optional[TodaySummaryResponse]:
-        """Get today's attendance summary"""
+    async def get_status_projection(self) -> Dict[str, Any]:
+        """Get the key system status fields as a plain dict (no model validation)"""
+        state_data = await self.state_repo.get_current_state() or {}
+        statistics = state_data.get('statistics', {})
+        return {
+            'status': state_data.get('script', {}).get('status', 'unknown'),
+            'daemon_running': state_data.get('schedule', {}).get('daemon_running', False),
+            'uptime': format_uptime(statistics.get('uptime_seconds', 0)),
+            'last_updated': state_data.get('last_updated')
+        }
+    
+    async def get_summary_projection(self) -> Dict[str, Any]:
+        """Get the key attendance summary fields as a plain dict (no model validation)"""
+        state_data = await self.state_repo.get_current_state() or {}
+        today_summary = state_data.get('today_summary') or {}
+        get = today_summary.get
+        return {
+            'date': get('date') or datetime.now().strftime('%Y-%m-%d'),
+            'signin_completed': _is_completed(today_summary, 'signin'),
+            'signout_completed': _is_completed(today_summary, 'signout'),
+            'total_attempts': get('signin_attempts', 0) + get('signout_attempts', 0)
+        }
+    
+    async def get_today_summary(self, state_data: Optional[Dict[str, Any]] = None) -> Optional[TodaySummaryResponse]:
+        """Get today's attendance summary (reads the state file unless state_data is given)"""
         try:
-            state_data = await self.state_repo.get_current_state()
+            if state_data is None:
+                state_data = await self.state_repo.get_current_state()
             if not state_data:
                 return self._get_fallback_today_summary()
             
@@ -69,51 +245,29 @@ class DashboardRepository:
             if not today_summary:
                 return self._get_fallback_today_summary()
             
-            # Format times if available
-            signin_time_formatted = None
-            signout_time_formatted = None
-            
-            if today_summary.get('signin_time'):
-                try:
-                    signin_dt = datetime.fromisoformat(today_summary['signin_time'])
-                    signin_time_formatted = signin_dt.strftime('%I:%M %p')
-                except:
-                    pass
+            # Bind the lookup once; every field below comes from this dict
+            get = today_summary.get
+            signin_status = get('signin_status', '❌ Pending')
+            signout_status = get('signout_status', '❌ Pending')
             
-            if today_summary.get('signout_time'):
-                try:
-                    signout_dt = datetime.fromisoformat(today_summary['signout_time'])
-                    signout_time_formatted = signout_dt.strftime('%I:%M %p')
-                except:
-                    pass
+            signin_completed = _is_completed(today_summary, 'signin')
+            signout_completed = _is_completed(today_summary, 'signout')
             
             # Calculate total attempts and failures
-            signin_attempts = today_summary.get('signin_attempts', 0)
-            signout_attempts = today_summary.get('signout_attempts', 0)
-            signin_failed = today_summary.get('signin_failed_attempts', 0)
-            signout_failed = today_summary.get('signout_failed_attempts', 0)
-            
-            total_attempts = signin_attempts + signout_attempts
-            failed_attempts = signin_failed + signout_failed
-            
-            # Determine next retry
-            next_retry = None
-            if today_summary.get('signin_next_retry'):
-                next_retry = today_summary['signin_next_retry']
-            elif today_summary.get('signout_next_retry'):
-                next_retry = today_summary['signout_next_retry']
+            total_attempts = get('signin_attempts', 0) + get('signout_attempts', 0)
+            failed_attempts = get('signin_failed_attempts', 0) + get('signout_failed_attempts', 0)
             
             return TodaySummaryResponse(
-                date=today_summary.get('date', datetime.now().strftime('%Y-%m-%d')),
-                signin_completed=today_summary.get('signin_status', '').startswith('✅'),
-                signout_completed=today_summary.get('signout_status', '').startswith('✅'),
-                signin_status=today_summary.get('signin_status', '❌ Pending'),
-                signout_status=today_summary.get('signout_status', '❌ Pending'),
-                signin_time=signin_time_formatted,
-                signout_time=signout_time_formatted,
+                date=get('date') or datetime.now().strftime('%Y-%m-%d'),
+                signin_completed=signin_completed,
+                signout_completed=signout_completed,
+                signin_status=signin_status,
+                signout_status=signout_status,
+                signin_time=_format_time_ampm(get('signin_time')),
+                signout_time=_format_time_ampm(get('signout_time')),
                 total_attempts=total_attempts,
                 failed_attempts=failed_attempts,
-                next_retry=next_retry
+                next_retry=get('signin_next_retry') or get('signout_next_retry') or None
             )
             
         except Exception as e:
@@ -123,11 +277,11 @@ class DashboardRepository:
     async def get_recent_activities(self, limit: int = 5) -> List[ActivityListItem]:
         """Get recent activity items"""
         try:
-            activity_dates = await self.activities_repo.list_activity_files()
+            activity_dates = await self.activities_repo.list_activity_files(limit)
             recent_activities = []
             
-            for date in activity_dates[:limit]:
-                activity_data = await self.activities_repo.get_activity_by_date(date)
+            activities = await self.activities_repo.get_activities_batch(activity_dates)
+            for activity_data in activities:
                 if activity_data:
                     activity_item = self._format_activity_item(activity_data)
                     recent_activities.append(activity_item)
@@ -138,14 +292,35 @@ class DashboardRepository:
             logger.error(f"Error getting recent activities: {e}")
             return []
     
+    async def iter_recent_activities(self, limit: int = 5) -> AsyncIterator[ActivityListItem]:
+        """Yield recent activity items one at a time, newest first"""
+        activity_dates = await self.activities_repo.list_activity_files(limit)
+        for date in activity_dates:
+            activity_data = await self.activities_repo.get_activity_by_date(date)
+            if activity_data:
+                yield self._format_activity_item(activity_data)
+    
     async def get_quick_stats(self) -> QuickStats:
         """Get quick statistics for dashboard"""
         try:
             # Get all activity files
             activity_dates = await self.activities_repo.list_activity_files()
-            total_days = len(activity_dates)
             
-            if total_days == 0:
+            # Past days rarely change, so their aggregate is reused until the activities directory does
+            today = datetime.now().strftime('%Y-%m-%d')
+            finalized_dates = [date for date in activity_dates if date < today]
+            stats = await self._load_rolling_stats(finalized_dates)
+            
+            # Today's activity may still change, so fold it into a copy only
+            open_dates = [date for date in reversed(activity_dates) if date >= today]
+            if open_dates:
+                stats = dict(stats, recent_results=list(stats['recent_results']))
+                open_activities = await self.activities_repo.get_activities_batch(open_dates)
+                for date, activity_data in zip(open_dates, open_activities):
+                    _fold_day_into_stats(stats, date, _summarize_activity(activity_data))
+            
+            # No files, or none that could be read
+            if stats['total_days'] == 0:
                 return QuickStats(
                     total_days_tracked=0,
                     success_rate=0.0,
@@ -155,55 +330,20 @@ class DashboardRepository:
                     avg_signout_time=None
                 )
             
-            successful_days = 0
-            current_streak = 0
-            last_7_days_success = 0
-            signin_times = []
-            signout_times = []
-            
-            # Process activities
-            for i, date in enumerate(activity_dates):
-                activity_data = await self.activities_repo.get_activity_by_date(date)
-                if activity_data:
-                    signin_complete = activity_data.get('signin_completed', False)
-                    signout_complete = activity_data.get('signout_completed', False)
-                    
-                    # Count successful days (both signin and signout)
-                    if signin_complete and signout_complete:
-                        successful_days += 1
-                        
-                        # Calculate current streak (from most recent)
-                        if i < len(activity_dates) and current_streak == i:
-                            current_streak += 1
-                        
-                        # Count last 7 days
-                        if i < 7:
-                            last_7_days_success += 1
-                    else:
-                        # Break streak if not successful
-                        if i < len(activity_dates) and current_streak == i:
-                            pass  # Stop counting streak
-                    
-                    # Collect times for averages
-                    if activity_data.get('signin_time'):
-                        signin_times.append(activity_data['signin_time'])
-                    if activity_data.get('signout_time'):
-                        signout_times.append(activity_data['signout_time'])
-            
             # Calculate success rate
-            success_rate = (successful_days / total_days * 100) if total_days > 0 else 0.0
-            
-            # Calculate average times
-            avg_signin_time = self._calculate_average_time(signin_times)
-            avg_signout_time = self._calculate_average_time(signout_times)
+            success_rate = stats['successful_days'] / stats['total_days'] * 100
             
             return QuickStats(
-                total_days_tracked=total_days,
+                total_days_tracked=stats['total_days'],
                 success_rate=round(success_rate, 1),
-                current_streak=current_streak,
-                last_7_days_success=last_7_days_success,
-                avg_signin_time=avg_signin_time,
-                avg_signout_time=avg_signout_time
+                current_streak=stats['current_streak'],
+                last_7_days_success=sum(stats['recent_results'][:7]),
+                avg_signin_time=self._format_average_time(
+                    stats['signin_minutes_sum'], stats['signin_count']
+                ),
+                avg_signout_time=self._format_average_time(
+                    stats['signout_minutes_sum'], stats['signout_count']
+                )
             )
             
         except Exception as e:
@@ -217,20 +357,29 @@ class DashboardRepository:
                 avg_signout_time=None
             )
     
-    async def get_system_alerts(self) -> List[Alert]:
-        """Get system alerts"""
+    async def get_system_alerts(self, state_data: Optional[Dict[str, Any]] = None) -> List[Alert]:
+        """Get system alerts (reads the state file unless state_data is given)"""
         alerts = []
         
+        # Alerts only change with the state file: reuse them while its mtime is unchanged
+        state_mtime = await self.state_repo.get_state_mtime_ns()
+        cached = self._alerts_cache
+        if state_mtime is not None and cached and cached[0] == state_mtime:
+            return list(cached[1])
+        
+        now_iso = datetime.now().isoformat()
         try:
-            # Check state data for issues
-            state_data = await self.state_repo.get_current_state()
+            # Check state data for issues (only data read after the stat above is cacheable)
+            cacheable = state_data is None and state_mtime is not None
+            if state_data is None:
+                state_data = await self.state_repo.get_current_state()
             
             if not state_data:
                 alerts.append(Alert(
                     type="warning",
                     title="No State Data",
                     message="Cannot read system state file. Check if GreytHR service is running.",
-                    timestamp=datetime.now().isoformat()
+                    timestamp=now_iso
                 ))
                 return alerts
             
@@ -241,7 +390,7 @@ class DashboardRepository:
                     type="error",
                     title="System Error",
                     message=f"Last error: {errors['last_error']}",
-                    timestamp=errors.get('last_error_time', datetime.now().isoformat())
+                    timestamp=errors.get('last_error_time', now_iso)
                 ))
             
             # Check daemon status
@@ -251,7 +400,7 @@ class DashboardRepository:
                     type="warning",
                     title="Service Not Running",
                     message="GreytHR attendance automation service is not running.",
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=now_iso,
                     action_url="/api/service/start",
                     action_text="Start Service"
                 ))
@@ -263,18 +412,21 @@ class DashboardRepository:
                     type="info",
                     title="Retry Scheduled",
                     message="Attendance action will be retried automatically.",
-                    timestamp=datetime.now().isoformat()
+                    timestamp=now_iso
                 ))
             
             # Uptime info is available in the main dashboard - no alert needed
             
+            if cacheable:
+                self._alerts_cache = (state_mtime, list(alerts))
+            
         except Exception as e:
             logger.error(f"Error getting system alerts: {e}")
             alerts.append(Alert(
                 type="error",
                 title="Alert System Error",
                 message=f"Failed to check system alerts: {str(e)}",
-                timestamp=datetime.now().isoformat()
+                timestamp=now_iso
             ))
         
         return alerts
@@ -283,6 +435,37 @@ class DashboardRepository:
     
     # Helper methods
     
+    async def _load_rolling_stats(self, finalized_dates: List[str]) -> Dict[str, Any]:
+        """Get the stats aggregate over past days, re-reading only activity files that changed"""
+        # Writing a new day's file (or replacing one) bumps the directory mtime; until then
+        # no file needs a stat()
+        key = (await self.activities_repo.get_directory_mtime_ns(), len(finalized_dates))
+        if self._rolling_stats is not None and self._rolling_stats[0] == key:
+            return self._rolling_stats[1]
+        
+        file_stats = await self.activities_repo.get_activity_file_stats(finalized_dates)
+        file_keys = {date: file_stat for date, file_stat in zip(finalized_dates, file_stats) if file_stat}
+        
+        known = self._day_stats
+        changed = [date for date, file_key in file_keys.items() if known.get(date, (None,))[0] != file_key]
+        activities = await self.activities_repo.get_activities_batch(changed) if changed else []
+        
+        # Days whose files are gone drop out; the rest are folded in oldest first
+        day_stats = {date: known[date] for date in file_keys if known.get(date, (None,))[0] == file_keys[date]}
+        for date, activity_data in zip(changed, activities):
+            day_stats[date] = (file_keys[date], _summarize_activity(activity_data))
+        stats = _empty_rolling_stats()
+        for date in reversed(list(file_keys)):
+            _fold_day_into_stats(stats, date, day_stats[date][1])
+        
+        self._day_stats = day_stats
+        self._rolling_stats = (key, stats)
+        return stats
+    
+    def invalidate_rolling_stats(self):
+        """Re-check every past activity file on the next quick-stats request"""
+        self._rolling_stats = None
+    
     def _get_fallback_status(self) -> SystemStatusResponse:
         """Get fallback status when no data is available"""
         return SystemStatusResponse(
@@ -313,46 +496,6 @@ class DashboardRepository:
     
     def _format_activity_item(self, activity_data: Dict[str, Any]) -> ActivityListItem:
         """Format activity data for list display"""
-        date = activity_data.get('date', 'unknown')
-        signin_complete = activity_data.get('signin_completed', False)
-        signout_complete = activity_data.get('signout_completed', False)
-        
-        # Determine status
-        if signin_complete and signout_complete:
-            status = "Complete"
-            status_color = "success"
-        elif signin_complete or signout_complete:
-            status = "Partial"
-            status_color = "warning"
-        else:
-            status = "Failed"
-            status_color = "danger"
-        
-        # Format times
-        signin_time_formatted = None
-        signout_time_formatted = None
-        
-        if activity_data.get('signin_time'):
-            try:
-                signin_dt = datetime.fromisoformat(activity_data['signin_time'])
-                signin_time_formatted = signin_dt.strftime('%I:%M %p')
-            except:
-                pass
-        
-        if activity_data.get('signout_time'):
-            try:
-                signout_dt = datetime.fromisoformat(activity_data['signout_time'])
-                signout_time_formatted = signout_dt.strftime('%I:%M %p')
-            except:
-                pass
-        
-        # Day of week
-        try:
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            day_of_week = date_obj.strftime('%A')
-        except:
-            day_of_week = "Unknown"
-        
         # Total attempts
         total_attempts = (
             activity_data.get('signin_attempts', 0) + 
@@ -365,38 +508,23 @@ class DashboardRepository:
             activity_data.get('signout_last_error')
         )
         
-        return ActivityListItem(
-            date=date,
-            day_of_week=day_of_week,
-            signin_completed=signin_complete,
-            signout_completed=signout_complete,
-            signin_time_formatted=signin_time_formatted,
-            signout_time_formatted=signout_time_formatted,
-            status=status,
-            status_color=status_color,
-            total_attempts=total_attempts,
-            has_errors=has_errors
+        return _build_activity_item(
+            activity_data.get('date', 'unknown'),
+            activity_data.get('signin_completed', False),
+            activity_data.get('signout_completed', False),
+            activity_data.get('signin_time'),
+            activity_data.get('signout_time'),
+            total_attempts,
+            has_errors
         )
     
-    def _calculate_average_time(self, times: List[str]) -> Optional[str]:
-        """Calculate average time from list of ISO timestamps"""
-        if not times:
+    def _format_average_time(self, total_minutes: int, count: int) -> Optional[str]:
+        """Format an average time of day from a running (sum, count) of minutes"""
+        if not count:
             return None
         
-        try:
-            parsed_times = []
-            for time_str in times:
-                dt = datetime.fromisoformat(time_str)
-                # Convert to minutes since midnight
-                minutes = dt.hour * 60 + dt.minute
-                parsed_times.append(minutes)
-            
-            avg_minutes = sum(parsed_times) / len(parsed_times)
-            avg_hour = int(avg_minutes // 60)
-            avg_min = int(avg_minutes % 60)
-            
-            return f"{avg_hour:02d}:{avg_min:02d}"
-            
-        except Exception as e:
-            logger.error(f"Error calculating average time: {e}")
-            return None
+        avg_minutes = total_minutes / count
+        avg_hour = int(avg_minutes // 60)
+        avg_min = int(avg_minutes % 60)
+        
+        return f"{avg_hour:02d}:{avg_min:02d}"
@@ -3,29 +3,80 @@ Dashboard API routes
 FastAPI endpoints for dashboard functionality
 """
 
+import asyncio
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, FastAPI, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, List, Union
+from pydantic import TypeAdapter
 
 from .controller import DashboardController
 from .repository import DashboardRepository
-from .schemas import DashboardOverview, QuickStats, Alert
+from .schemas import DashboardOverview, QuickStats, Alert, RefreshResponse
 from ..models.status import SystemStatusResponse, TodaySummaryResponse
-from ..models.activity import ActivityListItem
-from ..dependencies import get_greythr_integration_optional
+from ..models.activity import ActivityListItem, CompactActivityList
+from ..app_utils import TTLCache
+from ..json_io import FastJSONResponse
+from ..response_cache import CachedRoute, cached, invalidate_responses
+from ..dependencies import get_config_manager, get_greythr_integration
 
 logger = logging.getLogger('webui.dashboard.routes')
 
 # Create router
-router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+router = APIRouter(
+    prefix="/api/dashboard",
+    tags=["dashboard"],
+    default_response_class=FastJSONResponse,
+    route_class=CachedRoute
+)
+
+# Serialize responses straight to JSON bytes in pydantic-core (no dict round trip)
+_overview_adapter = TypeAdapter(DashboardOverview)
+_status_adapter = TypeAdapter(SystemStatusResponse)
+_summary_adapter = TypeAdapter(TodaySummaryResponse)
+_activities_adapter = TypeAdapter(List[ActivityListItem])
+_activity_adapter = TypeAdapter(ActivityListItem)
+_compact_activities_adapter = TypeAdapter(CompactActivityList)
+_quick_stats_adapter = TypeAdapter(QuickStats)
+_alerts_adapter = TypeAdapter(List[Alert])
+
+def _json_response(adapter: TypeAdapter, value: Any) -> Response:
+    """Build a JSON response from a value using its pre-built adapter"""
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
+def create_dashboard_controller() -> DashboardController:
+    """Build the dashboard controller shared by all requests"""
+    repository = DashboardRepository(get_greythr_integration().project_path)
+    
+    # One TTL cache for the controller's lifetime, so repeated dashboard polls are served from memory
+    config = get_config_manager().load_config()
+    cache = TTLCache(ttl=float(config.get("cache", {}).get("state_timeout", 30)))
+    return DashboardController(repository, cache)
+
+@asynccontextmanager
+async def dashboard_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the dashboard controller and watch the daemon's files while the app runs"""
+    controller = create_dashboard_controller()
+    app.state.dashboard_controller = controller
+    
+    # Drop cached data as soon as the daemon writes, rather than waiting out the TTLs
+    watcher = asyncio.create_task(
+        controller.watch_for_changes(lambda: invalidate_responses(router.prefix))
+    )
+    try:
+        yield
+    finally:
+        watcher.cancel()
+        with suppress(asyncio.CancelledError):
+            await watcher
 
 # Dependency to get dashboard controller
-def get_dashboard_controller(
-    integration = Depends(get_greythr_integration_optional)
-) -> DashboardController:
-    """Get dashboard controller with dependency injection"""
-    repository = DashboardRepository(integration.project_path)
-    return DashboardController(repository)
+async def get_dashboard_controller(request: Request) -> DashboardController:
+    """Get the app-wide dashboard controller created by dashboard_lifespan"""
+    # No sub-dependencies: this is a single attribute read
+    return request.app.state.dashboard_controller
 
 # Main dashboard endpoints
 
@@ -35,6 +86,7 @@ def get_dashboard_controller(
     summary="Get complete dashboard overview",
     description="Returns all dashboard data in a single response including system status, today's summary, recent activities, and alerts."
 )
+@cached("long", stale_if_error=True)
 async def get_dashboard_overview(
     controller: DashboardController = Depends(get_dashboard_controller)
 ):
@@ -42,7 +94,8 @@ async def get_dashboard_overview(
     try:
         logger.info("API: Getting dashboard overview")
         overview = await controller.get_dashboard_overview()
-        return overview
+        # CachedRoute sets the ETag from a hash of these bytes and answers If-None-Match
+        return _json_response(_overview_adapter, overview)
         
     except Exception as e:
         logger.error(f"API error getting dashboard overview: {e}")
@@ -57,6 +110,7 @@ async def get_dashboard_overview(
     summary="Get current system status",
     description="Returns current system status including daemon state, uptime, and resource usage."
 )
+@cached("short", stale_if_error=True)
 async def get_system_status(
     controller: DashboardController = Depends(get_dashboard_controller)
 ):
@@ -64,7 +118,7 @@ async def get_system_status(
     try:
         logger.info("API: Getting system status")
         status_data = await controller.get_system_status()
-        return status_data
+        return _json_response(_status_adapter, status_data)
         
     except Exception as e:
         logger.error(f"API error getting system status: {e}")
@@ -73,12 +127,35 @@ async def get_system_status(
             detail=f"Failed to get system status: {str(e)}"
         )
 
+@router.get(
+    "/status/simple",
+    summary="Get simple system status",
+    description="Returns the key system status fields for lightweight polling."
+)
+@cached("short", stale_if_error=True)
+async def get_simple_system_status(
+    controller: DashboardController = Depends(get_dashboard_controller)
+):
+    """Get simple system status"""
+    try:
+        logger.info("API: Getting simple system status")
+        status_data = await controller.get_status_projection()
+        return FastJSONResponse(content=status_data)
+        
+    except Exception as e:
+        logger.error(f"API error getting simple system status: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get system status: {str(e)}"
+        )
+
 @router.get(
     "/summary",
     response_model=TodaySummaryResponse,
     summary="Get today's attendance summary",
     description="Returns today's attendance summary including signin/signout status and attempt counts."
 )
+@cached("short", stale_if_error=True)
 async def get_today_summary(
     controller: DashboardController = Depends(get_dashboard_controller)
 ):
@@ -86,7 +163,7 @@ async def get_today_summary(
     try:
         logger.info("API: Getting today's summary")
         summary = await controller.get_today_summary()
-        return summary
+        return _json_response(_summary_adapter, summary)
         
     except Exception as e:
         logger.error(f"API error getting today's summary: {e}")
@@ -95,21 +172,47 @@ async def get_today_summary(
             detail=f"Failed to get today's summary: {str(e)}"
         )
 
+@router.get(
+    "/summary/simple",
+    summary="Get simple attendance summary",
+    description="Returns the key fields of today's attendance summary for lightweight polling."
+)
+@cached("short", stale_if_error=True)
+async def get_simple_today_summary(
+    controller: DashboardController = Depends(get_dashboard_controller)
+):
+    """Get simple attendance summary"""
+    try:
+        logger.info("API: Getting simple today's summary")
+        summary = await controller.get_summary_projection()
+        return FastJSONResponse(content=summary)
+        
+    except Exception as e:
+        logger.error(f"API error getting simple today's summary: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get today's summary: {str(e)}"
+        )
+
 @router.get(
     "/recent-activities",
-    response_model=List[ActivityListItem],
+    response_model=Union[List[ActivityListItem], CompactActivityList],
     summary="Get recent activities",
-    description="Returns a list of recent attendance activities."
+    description="Returns a list of recent attendance activities, or parallel per-field arrays with format=columnar."
 )
+@cached("normal", stale_if_error=True)
 async def get_recent_activities(
     limit: int = Query(5, ge=1, le=20, description="Number of recent activities to return"),
+    format: str = Query("items", pattern="^(items|columnar)$", description="Response layout: items or columnar"),
     controller: DashboardController = Depends(get_dashboard_controller)
 ):
     """Get recent activities"""
     try:
-        logger.info(f"API: Getting recent activities (limit={limit})")
+        logger.info(f"API: Getting recent activities (limit={limit}, format={format})")
         activities = await controller.get_recent_activities(limit)
-        return activities
+        if format == "columnar":
+            return _json_response(_compact_activities_adapter, CompactActivityList.from_items(activities))
+        return _json_response(_activities_adapter, activities)
         
     except Exception as e:
         logger.error(f"API error getting recent activities: {e}")
@@ -118,12 +221,32 @@ async def get_recent_activities(
             detail=f"Failed to get recent activities: {str(e)}"
         )
 
+@router.get(
+    "/recent-activities/stream",
+    response_class=StreamingResponse,
+    summary="Stream recent activities",
+    description="Streams recent attendance activities as newline-delimited JSON, one line per day as it is read."
+)
+async def stream_recent_activities(
+    limit: int = Query(5, ge=1, le=20, description="Number of recent activities to return"),
+    controller: DashboardController = Depends(get_dashboard_controller)
+):
+    """Stream recent activities as NDJSON"""
+    logger.info(f"API: Streaming recent activities (limit={limit})")
+    
+    async def ndjson_lines():
+        async for activity in controller.iter_recent_activities(limit):
+            yield _activity_adapter.dump_json(activity) + b"\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
 @router.get(
     "/quick-stats",
     response_model=QuickStats,
     summary="Get quick statistics",
     description="Returns quick statistics including success rate, streak, and averages."
 )
+@cached("normal", stale_if_error=True)
 async def get_quick_stats(
     controller: DashboardController = Depends(get_dashboard_controller)
 ):
@@ -131,7 +254,7 @@ async def get_quick_stats(
     try:
         logger.info("API: Getting quick stats")
         stats = await controller.get_quick_stats()
-        return stats
+        return _json_response(_quick_stats_adapter, stats)
         
     except Exception as e:
         logger.error(f"API error getting quick stats: {e}")
@@ -146,6 +269,7 @@ async def get_quick_stats(
     summary="Get system alerts",
     description="Returns current system alerts and notifications."
 )
+@cached("normal")
 async def get_system_alerts(
     controller: DashboardController = Depends(get_dashboard_controller)
 ):
@@ -153,11 +277,42 @@ async def get_system_alerts(
     try:
         logger.info("API: Getting system alerts")
         alerts = await controller.get_system_alerts()
-        return alerts
+        return _json_response(_alerts_adapter, alerts)
         
     except Exception as e:
         logger.error(f"API error getting system alerts: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get system alerts: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.post(
+    "/refresh",
+    response_model=RefreshResponse,
+    summary="Refresh dashboard data",
+    description="Drops cached dashboard data and reloads the overview in the background."
+)
+async def refresh_dashboard(
+    background_tasks: BackgroundTasks,
+    controller: DashboardController = Depends(get_dashboard_controller)
+):
+    """Refresh dashboard data"""
+    try:
+        logger.info("API: Refreshing dashboard data")
+        controller.invalidate_cache()
+        invalidate_responses(router.prefix)
+        
+        # Warm the overview after responding instead of making the client wait
+        background_tasks.add_task(controller.get_dashboard_overview)
+        return RefreshResponse(
+            success=True,
+            message="Dashboard refresh scheduled",
+            timestamp=datetime.now().isoformat()
+        )
+        
+    except Exception as e:
+        logger.error(f"API error refreshing dashboard: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to refresh dashboard: {str(e)}"
+        )
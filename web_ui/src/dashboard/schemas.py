@@ -3,7 +3,7 @@ Dashboard API schemas
 Pydantic models for request/response validation
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
 # Import the main models
@@ -11,16 +11,11 @@ from ..models.status import SystemStatusResponse, TodaySummaryResponse
 from ..models.activity import ActivityListItem
 
 # Dashboard-specific response models
-class DashboardOverview(BaseModel):
-    """Complete dashboard overview"""
-    system_status: SystemStatusResponse = Field(..., description="System status")
-    today_summary: TodaySummaryResponse = Field(..., description="Today's attendance summary")
-    recent_activities: List[ActivityListItem] = Field(..., description="Recent activities (last 5 days)")
-    quick_stats: "QuickStats" = Field(..., description="Quick statistics")
-    alerts: List["Alert"] = Field(default_factory=list, description="System alerts")
-
+# (component models come first so DashboardOverview needs no forward references)
 class QuickStats(BaseModel):
     """Quick statistics for dashboard"""
+    model_config = ConfigDict(frozen=True)
+
     total_days_tracked: int = Field(..., description="Total days with attendance data")
     success_rate: float = Field(..., description="Overall success rate percentage")
     current_streak: int = Field(..., description="Current successful attendance streak")
@@ -30,6 +25,8 @@ class QuickStats(BaseModel):
 
 class Alert(BaseModel):
     """System alert"""
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(..., description="Alert type (info, warning, error, success)")
     title: str = Field(..., description="Alert title")
     message: str = Field(..., description="Alert message")
@@ -38,5 +35,18 @@ class Alert(BaseModel):
     action_url: Optional[str] = Field(None, description="Optional action URL")
     action_text: Optional[str] = Field(None, description="Optional action button text")
 
-# Update forward references
-DashboardOverview.model_rebuild()
\ No newline at end of file
+class RefreshResponse(BaseModel):
+    """Dashboard refresh result"""
+    model_config = ConfigDict(frozen=True)
+
+    success: bool = Field(..., description="Whether the refresh was scheduled")
+    message: str = Field(..., description="Refresh result message")
+    timestamp: str = Field(..., description="Refresh request timestamp")
+
+class DashboardOverview(BaseModel):
+    """Complete dashboard overview"""
+    system_status: SystemStatusResponse = Field(..., description="System status")
+    today_summary: TodaySummaryResponse = Field(..., description="Today's attendance summary")
+    recent_activities: List[ActivityListItem] = Field(..., description="Recent activities (last 5 days)")
+    quick_stats: QuickStats = Field(..., description="Quick statistics")
+    alerts: List[Alert] = Field(default_factory=list, description="System alerts")
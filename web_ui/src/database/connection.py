@@ -4,31 +4,80 @@ Since GreytHR uses JSON files, this module handles file system operations
 """
 
 import json
+import asyncio
 import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-import aiofiles
+import fnmatch
 import glob
 
+from .. import json_io
+
 logger = logging.getLogger('webui.database')
 
+# Upper bound on concurrent file reads across the process (avoids FD exhaustion)
+MAX_CONCURRENT_READS = 16
+_read_semaphore: Optional[asyncio.Semaphore] = None
+
+def _get_read_semaphore() -> asyncio.Semaphore:
+    """Get the shared read semaphore (created lazily on the running loop)"""
+    global _read_semaphore
+    if _read_semaphore is None:
+        _read_semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
+    return _read_semaphore
+
+# Parsed JSON per path, reused while (mtime_ns, size) is unchanged. Entries are
+# shared between callers, so parsed data must be treated as read-only.
+JSON_CACHE_SIZE = 512
+_json_cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_json_cache_lock = threading.Lock()
+
+def _json_cache_discard(file_path: Path):
+    """Drop the cached parse of a file (after writing it)"""
+    with _json_cache_lock:
+        _json_cache.pop(str(file_path), None)
+
 class FileSystemRepository:
     """Base repository class for file system operations"""
     
     def __init__(self, base_path: Path):
         self.base_path = Path(base_path)
         
-    async def read_json_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Read JSON file asynchronously"""
+    async def read_json_file(self, file_path: Path, missing_ok: bool = False) -> Optional[Dict[str, Any]]:
+        """Read JSON file asynchronously (None if missing or invalid)"""
+        async with _get_read_semaphore():
+            return await asyncio.to_thread(self._load_json_file, file_path, missing_ok)
+    
+    def _load_json_file(self, file_path: Path, missing_ok: bool = False) -> Optional[Dict[str, Any]]:
+        """Read and parse a JSON file synchronously (for use in a worker thread)"""
         try:
-            if not file_path.exists():
+            st = os.stat(file_path)
+            key = str(file_path)
+            with _json_cache_lock:
+                cached = _json_cache.get(key)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    _json_cache.move_to_end(key)
+                    return cached[2]
+            
+            # Hand raw bytes straight to the parser (no decode step)
+            with open(file_path, 'rb') as f:
+                data = json_io.loads(f.read())
+            
+            with _json_cache_lock:
+                _json_cache[key] = (st.st_mtime_ns, st.st_size, data)
+                _json_cache.move_to_end(key)
+                if len(_json_cache) > JSON_CACHE_SIZE:
+                    _json_cache.popitem(last=False)
+            return data
+        except FileNotFoundError:
+            if not missing_ok:
                 logger.warning(f"File not found: {file_path}")
-                return None
-                
-            async with aiofiles.open(file_path, 'r') as f:
-                content = await f.read()
-                return json.loads(content)
+            return None
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in file {file_path}: {e}")
             return None
@@ -37,40 +86,64 @@ class FileSystemRepository:
             return None
     
     async def write_json_file(self, file_path: Path, data: Dict[str, Any]) -> bool:
-        """Write JSON file asynchronously"""
+        """Write JSON file asynchronously (atomically replaces the target)"""
         try:
             # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(file_path.parent.mkdir, parents=True, exist_ok=True)
             
-            async with aiofiles.open(file_path, 'w') as f:
-                await f.write(json.dumps(data, indent=2, default=str))
+            await asyncio.to_thread(self._replace_file, file_path, json_io.dumps_pretty(data))
+            _json_cache_discard(file_path)
             return True
         except Exception as e:
             logger.error(f"Error writing file {file_path}: {e}")
             return False
     
+    def _replace_file(self, file_path: Path, content: bytes):
+        """Atomically replace a file's content (for use in a worker thread)"""
+        # A unique temp file per write, so concurrent writers never share one, synced
+        # to disk before the rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    
     async def read_text_file(self, file_path: Path) -> Optional[str]:
         """Read text file asynchronously"""
         try:
-            if not file_path.exists():
-                logger.warning(f"File not found: {file_path}")
-                return None
-                
-            async with aiofiles.open(file_path, 'r') as f:
-                return await f.read()
+            # Open and read in one worker-thread trip; a missing file is just an exception
+            return await asyncio.to_thread(file_path.read_text)
+        except FileNotFoundError:
+            logger.warning(f"File not found: {file_path}")
+            return None
         except Exception as e:
             logger.error(f"Error reading text file {file_path}: {e}")
             return None
     
-    def list_files(self, directory: Path, pattern: str = "*") -> List[Path]:
-        """List files in directory with pattern"""
+    async def list_files(self, directory: Path, pattern: str = "*") -> List[Path]:
+        """List files in directory with pattern (newest first)"""
+        # Directory walks are blocking syscalls: keep them off the event loop
+        return await asyncio.to_thread(self._list_files_sync, directory, pattern)
+    
+    def _list_files_sync(self, directory: Path, pattern: str) -> List[Path]:
+        """List files in directory with pattern synchronously (for use in a worker thread)"""
         try:
-            if not directory.exists():
-                logger.warning(f"Directory not found: {directory}")
-                return []
-                
-            files = list(directory.glob(pattern))
-            return sorted(files, key=lambda f: f.stat().st_mtime, reverse=True)
+            # DirEntry.stat() is cached, so the sort costs one stat per file
+            with os.scandir(directory) as it:
+                entries = [
+                    entry for entry in it
+                    if not entry.name.startswith(".") and fnmatch.fnmatch(entry.name, pattern)
+                ]
+            entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+            return [Path(entry.path) for entry in entries]
+        except FileNotFoundError:
+            logger.warning(f"Directory not found: {directory}")
+            return []
         except Exception as e:
             logger.error(f"Error listing files in {directory}: {e}")
             return []
@@ -85,7 +158,16 @@ class StateRepository(FileSystemRepository):
     async def get_current_state(self) -> Optional[Dict[str, Any]]:
         """Get current system state"""
         state_file = self.state_dir / "current_state.json"
-        return await self.read_json_file(state_file)
+        # Open, read and parse in a single worker-thread trip
+        return await asyncio.to_thread(self._load_json_file, state_file)
+    
+    async def get_state_mtime_ns(self) -> Optional[int]:
+        """Get the state file modification time in nanoseconds (None if missing)"""
+        try:
+            st = await asyncio.to_thread(os.stat, self.state_dir / "current_state.json")
+            return st.st_mtime_ns
+        except OSError:
+            return None
     
     async def update_state(self, state_data: Dict[str, Any]) -> bool:
         """Update current system state"""
@@ -98,36 +180,103 @@ class ActivitiesRepository(FileSystemRepository):
     def __init__(self, project_path: Path):
         super().__init__(project_path)
         self.activities_dir = self.base_path / "activities"
+        # Sorted date listing, keyed on the activities directory mtime
+        self._list_cache: Optional[Tuple[int, List[str]]] = None
         
+    def _activity_file(self, date: str) -> Path:
+        """Get path to the activity file for a date"""
+        return self.activities_dir / f"attendance_{date}.json"
+    
     async def get_activity_by_date(self, date: str) -> Optional[Dict[str, Any]]:
         """Get activity data for specific date"""
-        activity_file = self.activities_dir / f"attendance_{date}.json"
-        return await self.read_json_file(activity_file)
-    
-    async def list_activity_files(self) -> List[str]:
-        """List all activity files"""
-        files = self.list_files(self.activities_dir, "attendance_*.json")
-        # Extract dates from filenames
-        dates = []
-        for file in files:
-            filename = file.name
-            if filename.startswith("attendance_") and filename.endswith(".json"):
-                date_str = filename[11:-5]  # Remove "attendance_" and ".json"
-                dates.append(date_str)
-        return sorted(dates, reverse=True)
+        # Open, read and parse in a single worker-thread trip
+        return await asyncio.to_thread(self._load_json_file, self._activity_file(date))
+    
+    async def get_activities_batch(self, dates: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get activity data for several dates at once (results follow input order)"""
+        semaphore = _get_read_semaphore()
+        
+        async def load(date: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._load_json_file, self._activity_file(date))
+        
+        return list(await asyncio.gather(*(load(date) for date in dates)))
+    
+    async def list_activity_files(self, limit: Optional[int] = None) -> List[str]:
+        """List activity dates, newest first (only the newest `limit` if given)"""
+        dates = await asyncio.to_thread(self._list_activity_dates)
+        return dates[:limit] if limit is not None else list(dates)
+    
+    def _list_activity_dates(self) -> List[str]:
+        """Get all activity dates, newest first (for use in a worker thread)"""
+        try:
+            # Adding or removing a file bumps the directory mtime; reuse the listing until then
+            mtime = os.stat(self.activities_dir).st_mtime_ns
+            if self._list_cache is None or self._list_cache[0] != mtime:
+                # Filenames carry the date, so no per-file stat() is needed
+                with os.scandir(self.activities_dir) as entries:
+                    dates = [
+                        entry.name[11:-5]  # Remove "attendance_" and ".json"
+                        for entry in entries
+                        if entry.name.startswith("attendance_") and entry.name.endswith(".json")
+                    ]
+                dates.sort(reverse=True)
+                self._list_cache = (mtime, dates)
+        except FileNotFoundError:
+            logger.warning(f"Directory not found: {self.activities_dir}")
+            return []
+        except Exception as e:
+            logger.error(f"Error listing files in {self.activities_dir}: {e}")
+            return []
+        
+        return self._list_cache[1]
+    
+    async def get_directory_mtime_ns(self) -> Optional[int]:
+        """Get the activities directory modification time in nanoseconds (None if missing)"""
+        try:
+            st = await asyncio.to_thread(os.stat, self.activities_dir)
+            return st.st_mtime_ns
+        except OSError:
+            return None
+    
+    async def get_activity_file_stats(self, dates: List[str]) -> List[Optional[Tuple[int, int]]]:
+        """Get (mtime_ns, size) of the activity files for several dates (None if missing)"""
+        def stat_files() -> List[Optional[Tuple[int, int]]]:
+            file_stats = []
+            for date in dates:
+                try:
+                    st = os.stat(self._activity_file(date))
+                    file_stats.append((st.st_mtime_ns, st.st_size))
+                except OSError:
+                    file_stats.append(None)
+            return file_stats
+        
+        return await asyncio.to_thread(stat_files)
+    
+    async def get_change_fingerprint(self) -> Tuple[Optional[int], Optional[int]]:
+        """Get mtimes (ns) of the activities directory and the newest activity file"""
+        latest = await self.list_activity_files(1)
+        
+        def stat_mtimes() -> Tuple[Optional[int], Optional[int]]:
+            mtimes = []
+            # The daemon rewrites today's file in place, which leaves the directory mtime alone
+            for path in (self.activities_dir, self._activity_file(latest[0]) if latest else None):
+                try:
+                    mtimes.append(os.stat(path).st_mtime_ns if path else None)
+                except OSError:
+                    mtimes.append(None)
+            return tuple(mtimes)
+        
+        return await asyncio.to_thread(stat_mtimes)
     
     async def get_activities_in_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Get activities in date range"""
-        activities = []
         dates = await self.list_activity_files()
+        in_range = [date for date in dates if start_date <= date <= end_date]
         
-        for date in dates:
-            if start_date <= date <= end_date:
-                activity = await self.get_activity_by_date(date)
-                if activity:
-                    activities.append(activity)
-        
-        return activities
+        # Read the matching days concurrently instead of one at a time
+        activities = await self.get_activities_batch(in_range)
+        return [activity for activity in activities if activity]
 
 class LogsRepository(FileSystemRepository):
     """Repository for log file operations"""
@@ -137,44 +286,79 @@ class LogsRepository(FileSystemRepository):
         self.logs_dir = self.base_path / "logs"
         
     async def list_log_files(self) -> List[Dict[str, Any]]:
-        """List all log files with metadata"""
-        files = self.list_files(self.logs_dir, "*.log")
-        log_files = []
+        """List all log files with metadata (newest first)"""
+        return await asyncio.to_thread(self._describe_log_files)
+    
+    def _describe_log_files(self) -> List[Dict[str, Any]]:
+        """Collect metadata for log files in one directory pass (for use in a worker thread)"""
+        described = []
         
-        for file in files:
-            try:
-                stat = file.stat()
-                log_files.append({
-                    "filename": file.name,
-                    "size": stat.st_size,
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "path": str(file)
-                })
-            except Exception as e:
-                logger.error(f"Error getting file stats for {file}: {e}")
+        try:
+            with os.scandir(self.logs_dir) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or not entry.name.endswith(".log"):
+                        continue
+                    try:
+                        # Reuse the DirEntry stat for both the sort and the metadata
+                        described.append((entry, entry.stat()))
+                    except Exception as e:
+                        logger.error(f"Error getting file stats for {entry.path}: {e}")
+        except FileNotFoundError:
+            logger.warning(f"Directory not found: {self.logs_dir}")
+            return []
+        except Exception as e:
+            logger.error(f"Error listing files in {self.logs_dir}: {e}")
+            return []
         
-        return log_files
+        described.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        return [
+            {
+                "filename": entry.name,
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "path": entry.path
+            }
+            for entry, stat in described
+        ]
     
     async def read_log_file(self, filename: str, lines: Optional[int] = None) -> Optional[str]:
         """Read log file content"""
         log_file = self.logs_dir / filename
         
-        if not log_file.exists():
-            return None
-            
         try:
             if lines is None:
                 return await self.read_text_file(log_file)
             else:
-                # Read last N lines
-                async with aiofiles.open(log_file, 'r') as f:
-                    content = await f.read()
-                    lines_list = content.split('\n')
-                    return '\n'.join(lines_list[-lines:]) if lines_list else ""
+                # Read last N lines without loading the whole file
+                return await asyncio.to_thread(self._read_tail, log_file, lines)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Error reading log file {filename}: {e}")
             return None
     
+    def _read_tail(self, log_file: Path, lines: int, chunk_size: int = 8192) -> str:
+        """Read the last N lines of a file by reading blocks backwards from the end"""
+        with open(log_file, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            if lines <= 0:
+                f.seek(0)
+                return f.read().decode('utf-8', 'replace')
+            
+            # The last N lines start after the Nth newline from the end
+            blocks = []
+            newlines = 0
+            while pos > 0 and newlines < lines:
+                read_size = min(chunk_size, pos)
+                pos -= read_size
+                f.seek(pos)
+                block = f.read(read_size)
+                blocks.append(block)
+                newlines += block.count(b'\n')
+        
+        content = b''.join(reversed(blocks)).decode('utf-8', 'replace')
+        return '\n'.join(content.split('\n')[-lines:])
+    
     async def tail_log_file(self, filename: str, lines: int = 50) -> Optional[str]:
         """Get last N lines from log file"""
         return await self.read_log_file(filename, lines)
@@ -3,7 +3,9 @@ FastAPI dependencies for GreytHR Web UI Dashboard
 Following the established dependency injection patterns
 """
 
-from functools import lru_cache
+import calendar
+import re
+import threading
 from fastapi import Depends, HTTPException, status
 from typing import Optional
 import logging
@@ -12,19 +14,26 @@ from .app_utils import ConfigManager, GreytHRIntegration
 
 logger = logging.getLogger('webui.dependencies')
 
-# Configuration dependencies
-@lru_cache()
+# Configuration dependencies (module-level singletons: a plain global read per call)
+_config_manager = ConfigManager()
+_greythr_integration: Optional[GreytHRIntegration] = None
+_integration_lock = threading.Lock()
+
 def get_config_manager() -> ConfigManager:
     """Get singleton ConfigManager instance"""
-    return ConfigManager()
+    return _config_manager
 
-@lru_cache()
 def get_greythr_integration() -> GreytHRIntegration:
-    """Get singleton GreytHRIntegration instance"""
-    config_manager = get_config_manager()
-    config = config_manager.load_config()
-    project_path = config.get("greythr", {}).get("project_path", "../")
-    return GreytHRIntegration(project_path)
+    """Get singleton GreytHRIntegration instance (created on first use)"""
+    global _greythr_integration
+    if _greythr_integration is None:
+        # Sync dependencies run in the threadpool, so guard the first creation
+        with _integration_lock:
+            if _greythr_integration is None:
+                config = _config_manager.load_config()
+                project_path = config.get("greythr", {}).get("project_path", "../")
+                _greythr_integration = GreytHRIntegration(project_path)
+    return _greythr_integration
 
 # Health check dependency
 async def check_greythr_project_accessible(
@@ -76,18 +85,18 @@ def get_pagination_params(
     """Get pagination parameters with validation"""
     return PaginationParams(page=page, size=size)
 
+# Only allow specific log file patterns (str.startswith checks the whole tuple in C)
+ALLOWED_LOG_PREFIXES = (
+    'webui_',
+    'greythr_attendance_',
+    'launchd_stdout',
+    'launchd_stderr'
+)
+
 # Log file validation dependency
 def validate_log_filename(filename: str) -> str:
     """Validate log filename for security"""
-    # Only allow specific log file patterns
-    allowed_patterns = [
-        'webui_',
-        'greythr_attendance_',
-        'launchd_stdout',
-        'launchd_stderr'
-    ]
-    
-    if not any(filename.startswith(pattern) for pattern in allowed_patterns):
+    if not filename.startswith(ALLOWED_LOG_PREFIXES) or not filename.endswith('.log'):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid log filename: {filename}"
@@ -103,20 +112,20 @@ def validate_log_filename(filename: str) -> str:
     return filename
 
 # Date validation dependency
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
 def validate_date_format(date_str: str) -> str:
     """Validate date format (YYYY-MM-DD)"""
-    import re
-    from datetime import datetime
-    
-    if not re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid date format. Use YYYY-MM-DD"
         )
     
-    try:
-        datetime.strptime(date_str, '%Y-%m-%d')
-    except ValueError:
+    # Range-check with integers instead of building a datetime
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if year < 1 or not 1 <= month <= 12 or not 1 <= day <= calendar.monthrange(year, month)[1]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid date value"
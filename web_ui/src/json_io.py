@@ -0,0 +1,41 @@
+"""
+JSON helpers for GreytHR Web UI Dashboard
+Uses orjson when it is installed and falls back to the stdlib json module
+"""
+
+import json
+from typing import Any, Union
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# always catch json.JSONDecodeError regardless of the backend in use
+JSONDecodeError = json.JSONDecodeError
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from raw bytes (preferred) or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode()
+
+def dumps_pretty(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (unknown types fall back to str)"""
+    if orjson is not None:
+        # Pass datetimes through to default=str so output matches the stdlib path
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(data, option=option, default=str)
+    return json.dumps(data, indent=2, default=str).encode()
+
+# Response class for JSON APIs: orjson-backed when available
+FastJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
@@ -10,6 +10,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+from .app_utils import YamlLoader
+
 def setup_logging(config_path: str = "conf", log_level: str = "INFO") -> logging.Logger:
     """
     Setup logging configuration for the web UI application
@@ -27,7 +29,7 @@ def setup_logging(config_path: str = "conf", log_level: str = "INFO") -> logging
     if config_file.exists():
         try:
             with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlLoader)
             
             # Update file paths with today's date
             if 'handlers' in config:
@@ -88,13 +90,14 @@ class RequestLoggingMiddleware:
         self.logger = get_logger('requests')
     
     async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
+        # Skip all per-request string work when INFO is disabled
+        if scope["type"] == "http" and self.logger.isEnabledFor(logging.INFO):
             method = scope["method"]
             path = scope["path"]
             query_string = scope.get("query_string", b"").decode()
             client = scope.get("client", ["unknown", 0])
             
-            # Log request
-            self.logger.info(f"{method} {path}{'?' + query_string if query_string else ''} - Client: {client[0]}")
+            # Log request (formatted lazily by the logging module)
+            self.logger.info("%s %s%s%s - Client: %s", method, path, '?' if query_string else '', query_string, client[0])
         
         await self.app(scope, receive, send)
@@ -2,66 +2,103 @@
 Logs repository for managing system logs
 """
 
+import heapq
 import logging
 import re
+import threading
 import asyncio
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from datetime import date, datetime
+from typing import Callable, Dict, List, NamedTuple, Optional, Any, Sequence, Tuple
 import os
 
-import aiofiles
-
 logger = logging.getLogger('webui.logs.repository')
 
+# Typical log format: 2024-01-01 12:00:00,123 - LEVEL - module - message
+_LOG_LINE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3})\s*-\s*(\w+)\s*-\s*([^-]+)\s*-\s*(.*)$')
+
+def _split_lines(text: str) -> List[str]:
+    """Split text at \\n, \\r\\n or \\r, like reading the file in text mode"""
+    return text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+
+class _ParsedLogFile(NamedTuple):
+    """Parsed entries of a log file up to `offset` (end of its last complete line), in file order"""
+    inode: int
+    mtime_ns: int
+    size: int
+    offset: int
+    dated: Tuple[Dict[str, Any], ...]
+    undated: Tuple[Dict[str, Any], ...]
+
+LogEntries = Tuple[Sequence[Dict[str, Any]], Sequence[Dict[str, Any]]]
+
+LogFilter = Callable[[Dict[str, Any]], bool]
+
+def _entry_filter(date_filter: Optional[str], level_upper: Optional[str],
+                  search_lower: Optional[str]) -> Optional[LogFilter]:
+    """Build one predicate for the requested filters (None when nothing is filtered)"""
+    if not (date_filter or level_upper or search_lower):
+        return None
+    
+    # Unformatted lines have no timestamp of their own and are reported as logged now
+    today = date.today().isoformat()
+    
+    def match(log_entry: Dict[str, Any]) -> bool:
+        # Compare the YYYY-MM-DD part of the timestamp
+        timestamp = log_entry['timestamp']
+        if date_filter and (timestamp[:10] if timestamp else today) != date_filter:
+            return False
+        if level_upper and log_entry['level'].upper() != level_upper:
+            return False
+        return not search_lower or search_lower in log_entry['message'].lower()
+    
+    return match
+
+def _log_timestamp(log: Dict[str, Any]) -> str:
+    """Sort key for parsed log entries"""
+    return log.get('timestamp', '')
+
+def _build_logs(dated: List[Dict[str, Any]], undated: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """Pick the newest entries, newest first, as fresh dicts safe to hand out"""
+    # Unformatted lines are stamped with the current time, so they come first (last read first)
+    now_iso = datetime.now().isoformat()
+    undated = undated[::-1]
+    if limit > 0:
+        undated = undated[:limit]
+        dated = heapq.nlargest(limit - len(undated), dated, key=_log_timestamp)
+    else:
+        dated = sorted(dated, key=_log_timestamp, reverse=True)
+    return [{**log_entry, 'timestamp': now_iso} for log_entry in undated] + [dict(log_entry) for log_entry in dated]
+
 class LogsRepository:
     """Repository for managing system logs"""
     
     def __init__(self, project_path: Path):
         self.project_path = Path(project_path)
         self.logs_dir = self.project_path / "logs"
+        # Parsed entries per log file, extended as the file grows. Cached entries are
+        # shared between requests: they are only read, and responses are built from copies.
+        self._parse_cache: Dict[Path, _ParsedLogFile] = {}
+        # Files are parsed in worker threads, concurrently for different requests
+        self._cache_lock = threading.Lock()
         
     async def get_recent_logs(self, limit: int = 500, level: Optional[str] = None, 
-                            date_filter: Optional[str] = None) -> Dict[str, Any]:
+                            date_filter: Optional[str] = None, search: Optional[str] = None) -> Dict[str, Any]:
         """Get recent log entries"""
         try:
-            if not self.logs_dir.exists():
+            # Get all log files sorted by modification time, off the event loop
+            log_files = await asyncio.to_thread(self._scan_log_files)
+            if log_files is None:
                 return {'logs': [], 'total': 0}
             
-            all_logs = []
-            
-            # Get all log files sorted by modification time
-            log_files = []
-            for file_path in self.logs_dir.glob("*.log"):
-                try:
-                    stat = file_path.stat()
-                    log_files.append((file_path, stat.st_mtime))
-                except OSError:
-                    continue
-            
-            # Sort by modification time (newest first)
-            log_files.sort(key=lambda x: x[1], reverse=True)
-            
-            # Read logs from files
-            for file_path, _ in log_files[:10]:  # Limit to 10 most recent files
-                try:
-                    file_logs = await self._read_log_file(file_path, date_filter)
-                    all_logs.extend(file_logs)
-                except Exception as e:
-                    logger.error(f"Error reading log file {file_path}: {e}")
-                    continue
-            
-            # Sort all logs by timestamp (newest first)
-            all_logs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            
-            # Filter by level if specified
-            if level:
-                level_upper = level.upper()
-                all_logs = [log for log in all_logs if log.get('level', '').upper() == level_upper]
+            recent_files = [file_path for file_path, _ in log_files[:10]]  # Limit to 10 most recent files
+            self._prune_parse_cache(recent_files)
             
-            # Apply limit
-            if limit > 0:
-                all_logs = all_logs[:limit]
+            # Filters are applied while reading each file, before entries are merged
+            match = _entry_filter(date_filter, level.upper() if level else None,
+                                  search.lower() if search else None)
+            dated, undated = await self._read_log_files(recent_files, match)
+            all_logs = _build_logs(dated, undated, limit)
             
             return {
                 'logs': all_logs,
@@ -73,66 +110,160 @@ class LogsRepository:
             logger.error(f"Error getting recent logs: {e}")
             return {'logs': [], 'total': 0, 'error': str(e)}
     
-    async def _read_log_file(self, file_path: Path, date_filter: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Read logs from a specific file"""
-        logs = []
+    async def _read_log_files(self, file_paths: List[Path],
+                              match: Optional[LogFilter] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Read several log files concurrently: (timestamped entries, unformatted lines), in file order"""
+        dated, undated = [], []
+        results = await asyncio.gather(
+            *(self._read_log_file(file_path, match) for file_path in file_paths),
+            return_exceptions=True
+        )
+        for file_path, file_logs in zip(file_paths, results):
+            if isinstance(file_logs, Exception):
+                logger.error(f"Error reading log file {file_path}: {file_logs}")
+                continue
+            dated.extend(file_logs[0])
+            undated.extend(file_logs[1])
+        return dated, undated
+    
+    async def get_log_file_path(self, filename: str) -> Optional[Path]:
+        """Get the path of a *.log file in the logs directory, or None if there is no such file"""
+        return await asyncio.to_thread(self._resolve_log_file, filename)
+    
+    def _resolve_log_file(self, filename: str) -> Optional[Path]:
+        """Resolve a log file name, refusing anything that lands outside the logs directory (for use in a worker thread)"""
+        if not filename.endswith(".log"):
+            return None
+        try:
+            logs_dir = self.logs_dir.resolve(strict=True)
+            file_path = (logs_dir / filename).resolve(strict=True)
+        except (OSError, RuntimeError):
+            return None
+        # Symlinks are followed, so check where the file really is
+        if file_path.parent != logs_dir or not file_path.is_file():
+            return None
+        return file_path
+    
+    def _scan_log_files(self) -> Optional[List[Tuple[Path, float]]]:
+        """Get all *.log files with their mtimes, newest first, or None without a logs directory (for use in a worker thread)"""
+        log_files = []
+        try:
+            with os.scandir(self.logs_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".log"):
+                        continue
+                    try:
+                        if entry.is_file():
+                            log_files.append((Path(entry.path), entry.stat().st_mtime))
+                    except OSError:
+                        continue
+        except FileNotFoundError:
+            return None
         
+        # Sort by modification time (newest first)
+        log_files.sort(key=lambda x: x[1], reverse=True)
+        return log_files
+    
+    def _prune_parse_cache(self, keep: List[Path]):
+        """Drop cached parses of files other than `keep`"""
+        with self._cache_lock:
+            for cached_path in [path for path in self._parse_cache if path not in keep]:
+                del self._parse_cache[cached_path]
+    
+    async def _read_log_file(self, file_path: Path, match: Optional[LogFilter] = None) -> LogEntries:
+        """Read logs from a specific file: (timestamped entries, unformatted lines)"""
         try:
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                lines = await f.readlines()
-                
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                log_entry = self._parse_log_line(line)
-                if log_entry:
-                    # Apply date filter if specified
-                    if date_filter:
-                        log_date = log_entry.get('timestamp', '')[:10]  # Get YYYY-MM-DD part
-                        if log_date != date_filter:
-                            continue
-                    
-                    logs.append(log_entry)
+            dated, undated = await asyncio.to_thread(self._load_log_entries, file_path)
+            if match is None:
+                return dated, undated
+            return [log_entry for log_entry in dated if match(log_entry)], [log_entry for log_entry in undated if match(log_entry)]
                         
         except Exception as e:
             logger.error(f"Error reading log file {file_path}: {e}")
+            return [], []
+    
+    def _load_log_entries(self, file_path: Path) -> LogEntries:
+        """Get all parsed entries of a file, parsing only bytes appended since the cached parse (for use in a worker thread)"""
+        stat = os.stat(file_path)
+        with self._cache_lock:
+            cached = self._parse_cache.get(file_path)
+        unchanged = cached is not None and (cached.inode, cached.mtime_ns, cached.size) == (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if unchanged and cached.offset == stat.st_size:
+            return cached.dated, cached.undated
+        
+        # Same file grown since last parse (or ending in a partial line): continue from the last complete line
+        offset, dated, undated = 0, (), ()
+        if cached and cached.inode == stat.st_ino and (unchanged or cached.size < stat.st_size):
+            offset, dated, undated = cached.offset, cached.dated, cached.undated
+        
+        with open(file_path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        
+        # A trailing partial line is returned but left out of the cache
+        end = data.rfind(b'\n') + 1
+        new_dated, new_undated = self._parse_chunk(data[:end])
+        dated, undated = dated + tuple(new_dated), undated + tuple(new_undated)
+        with self._cache_lock:
+            self._parse_cache[file_path] = _ParsedLogFile(stat.st_ino, stat.st_mtime_ns, stat.st_size, offset + end, dated, undated)
+        if end < len(data):
+            new_dated, new_undated = self._parse_chunk(data[end:])
+            dated, undated = dated + tuple(new_dated), undated + tuple(new_undated)
+        return dated, undated
+    
+    def _parse_chunk(self, data: bytes) -> LogEntries:
+        """Parse every line of a chunk"""
+        return self._split_dated(self._parse_lines(_split_lines(data.decode('utf-8', 'replace'))))
+    
+    def _split_dated(self, entries: List[Dict[str, Any]]) -> LogEntries:
+        """Separate timestamped entries from unformatted lines, keeping file order"""
+        dated, undated = [], []
+        for log_entry in entries:
+            (dated if log_entry['timestamp'] else undated).append(log_entry)
+        return dated, undated
+    
+    def _parse_lines(self, lines: List[str]) -> List[Dict[str, Any]]:
+        """Parse raw lines into log entries, skipping blank lines"""
+        entries = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
             
-        return logs
+            log_entry = self._parse_log_line(line)
+            if log_entry:
+                entries.append(log_entry)
+        return entries
     
     def _parse_log_line(self, line: str) -> Optional[Dict[str, Any]]:
         """Parse a single log line into structured data"""
         try:
-            # Pattern for typical log format: 2024-01-01 12:00:00,123 - LEVEL - module - message
-            pattern = r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3})\s*-\s*(\w+)\s*-\s*([^-]+)\s*-\s*(.*)$'
-            match = re.match(pattern, line)
+            match = _LOG_LINE_RE.match(line)
             
             if match:
                 timestamp_str, level, module, message = match.groups()
                 
-                # Parse timestamp
-                try:
-                    timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f')
-                    iso_timestamp = timestamp.isoformat()
-                except:
-                    iso_timestamp = timestamp_str
+                # The regex fixes every field's position, so build the ISO form by slicing
+                # (datetime.isoformat() leaves out a zero fraction)
+                millis = timestamp_str[20:23]
+                iso_timestamp = f"{timestamp_str[:10]}T{timestamp_str[11:19]}"
+                if millis != '000':
+                    iso_timestamp += f".{millis}000"
                 
                 return {
                     'timestamp': iso_timestamp,
                     'level': level.strip(),
                     'module': module.strip(),
-                    'message': message.strip(),
-                    'raw_line': line
+                    'message': message.strip()
                 }
             else:
                 # For lines that don't match the pattern, treat as raw message
+                # (no timestamp: it is filled in with the current time for each response)
                 return {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': None,
                     'level': 'INFO',
                     'module': 'unknown',
-                    'message': line,
-                    'raw_line': line
+                    'message': line
                 }
             
         except Exception as e:
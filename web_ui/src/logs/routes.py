@@ -4,23 +4,37 @@ FastAPI endpoints for system log management
 """
 
 import logging
+from functools import lru_cache
+from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import FileResponse, StreamingResponse
 from typing import Optional
 
 from .repository import LogsRepository
-from ..dependencies import get_greythr_integration_optional
+from ..dependencies import get_greythr_integration_optional, validate_log_filename
+from ..json_io import FastJSONResponse, dumps
 
 logger = logging.getLogger('webui.logs.routes')
 
 # Create router
-router = APIRouter(prefix="/api/logs", tags=["logs"])
+router = APIRouter(
+    prefix="/api/logs",
+    tags=["logs"],
+    default_response_class=FastJSONResponse
+)
+
+# One repository per project path for the app's lifetime
+@lru_cache(maxsize=4)
+def _repository_for(project_path: Path) -> LogsRepository:
+    """Get the shared logs repository for a project path"""
+    return LogsRepository(project_path)
 
 # Dependency to get logs repository
 def get_logs_repository(
     integration = Depends(get_greythr_integration_optional)
 ) -> LogsRepository:
     """Get logs repository with dependency injection"""
-    return LogsRepository(integration.project_path)
+    return _repository_for(integration.project_path)
 
 @router.get(
     "/recent",
@@ -31,27 +45,84 @@ async def get_recent_logs(
     limit: int = Query(500, description="Maximum number of log entries to return"),
     level: Optional[str] = Query(None, description="Filter by log level (error, warning, info, debug)"),
     date_filter: Optional[str] = Query(None, description="Filter by date (YYYY-MM-DD)"),
+    search: Optional[str] = Query(None, description="Filter by text in the log message (case-insensitive)"),
     repository: LogsRepository = Depends(get_logs_repository)
 ):
     """Get recent log entries"""
     try:
-        logger.info(f"API: Getting recent logs (limit={limit}, level={level}, date={date_filter})")
+        logger.info("API: Getting recent logs (limit=%s, level=%s, date=%s, search=%s)", limit, level, date_filter, search)
         
         if limit > 10000:
             raise ValueError("Limit cannot exceed 10,000 entries")
         
-        logs_data = await repository.get_recent_logs(limit, level, date_filter)
-        return logs_data
+        logs_data = await repository.get_recent_logs(limit, level, date_filter, search)
+        return FastJSONResponse(content=logs_data)
         
     except ValueError as e:
-        logger.error(f"Validation error in recent logs API: {e}")
+        logger.error("Validation error in recent logs API: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"API error getting recent logs: {e}")
+        logger.error("API error getting recent logs: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get recent logs: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.get(
+    "/recent/stream",
+    response_class=StreamingResponse,
+    summary="Get recent log entries as NDJSON",
+    description="Returns recent system log entries as newline-delimited JSON with optional filtering."
+)
+async def stream_recent_logs(
+    limit: int = Query(500, description="Maximum number of log entries to return"),
+    level: Optional[str] = Query(None, description="Filter by log level (error, warning, info, debug)"),
+    date_filter: Optional[str] = Query(None, description="Filter by date (YYYY-MM-DD)"),
+    search: Optional[str] = Query(None, description="Filter by text in the log message (case-insensitive)"),
+    repository: LogsRepository = Depends(get_logs_repository)
+):
+    """Get recent log entries as NDJSON, one entry per line"""
+    logger.info("API: Getting recent logs as NDJSON (limit=%s, level=%s, date=%s, search=%s)", limit, level, date_filter, search)
+    
+    if limit > 10000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Limit cannot exceed 10,000 entries"
+        )
+    
+    # Entries from several files are merged before the newest are known, so the
+    # whole result is built first and only its serialization is done per line
+    logs_data = await repository.get_recent_logs(limit, level, date_filter, search)
+    
+    def ndjson_lines():
+        for log_entry in logs_data['logs']:
+            yield dumps(log_entry) + b"\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+@router.get(
+    "/files/{filename}/raw",
+    response_class=FileResponse,
+    summary="Download a raw log file",
+    description="Returns the full contents of a log file as plain text."
+)
+async def get_raw_log_file(
+    filename: str = Depends(validate_log_filename),
+    repository: LogsRepository = Depends(get_logs_repository)
+):
+    """Serve a log file as-is"""
+    logger.info("API: Serving raw log file %s", filename)
+    
+    file_path = await repository.get_log_file_path(filename)
+    if file_path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Log file not found: {filename}"
+        )
+    
+    # FileResponse streams from the file in chunks (or hands it to the server for
+    # sendfile where supported) instead of loading it into memory
+    return FileResponse(file_path, media_type="text/plain")
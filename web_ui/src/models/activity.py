@@ -3,12 +3,14 @@ Pydantic models for activity/attendance data
 Based on the attendance_YYYY-MM-DD.json structure from GreytHR
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 
 class AttendanceActivity(BaseModel):
     """Single day attendance activity model"""
+    model_config = ConfigDict(frozen=True)
+
     date: str = Field(..., description="Date in YYYY-MM-DD format")
     signin_completed: bool = Field(False, description="Sign-in completed for this date")
     signout_completed: bool = Field(False, description="Sign-out completed for this date")
@@ -26,6 +28,8 @@ class AttendanceActivity(BaseModel):
 
 class ActivityListItem(BaseModel):
     """Activity list item for API responses"""
+    model_config = ConfigDict(frozen=True)
+
     date: str = Field(..., description="Date in YYYY-MM-DD format")
     day_of_week: str = Field(..., description="Day of the week")
     signin_completed: bool = Field(..., description="Sign-in completed")
@@ -37,8 +41,32 @@ class ActivityListItem(BaseModel):
     total_attempts: int = Field(..., description="Total attempts for the day")
     has_errors: bool = Field(..., description="Whether there were any errors")
 
+class CompactActivityList(BaseModel):
+    """Activity list items as parallel per-field arrays (index i across fields is one item)"""
+    model_config = ConfigDict(frozen=True)
+
+    date: List[str] = Field(default_factory=list, description="Dates in YYYY-MM-DD format")
+    day_of_week: List[str] = Field(default_factory=list, description="Days of the week")
+    signin_completed: List[bool] = Field(default_factory=list, description="Sign-in completed")
+    signout_completed: List[bool] = Field(default_factory=list, description="Sign-out completed")
+    signin_time_formatted: List[Optional[str]] = Field(default_factory=list, description="Formatted sign-in times")
+    signout_time_formatted: List[Optional[str]] = Field(default_factory=list, description="Formatted sign-out times")
+    status: List[str] = Field(default_factory=list, description="Overall day statuses")
+    status_color: List[str] = Field(default_factory=list, description="Status colors for UI")
+    total_attempts: List[int] = Field(default_factory=list, description="Total attempts per day")
+    has_errors: List[bool] = Field(default_factory=list, description="Whether each day had errors")
+
+    @classmethod
+    def from_items(cls, items: List[ActivityListItem]) -> "CompactActivityList":
+        """Build the columnar form of a list of activity items"""
+        return cls.model_construct(**{
+            name: [getattr(item, name) for item in items] for name in ActivityListItem.model_fields
+        })
+
 class ActivitySummary(BaseModel):
     """Summary statistics for activities"""
+    model_config = ConfigDict(frozen=True)
+
     total_days: int = Field(..., description="Total days with activity")
     successful_days: int = Field(..., description="Days with both signin/signout completed")
     partial_days: int = Field(..., description="Days with only signin or signout")
@@ -53,17 +81,23 @@ class ActivitySummary(BaseModel):
 # API Response Models
 class ActivityResponse(BaseModel):
     """API response for single activity"""
+    model_config = ConfigDict(frozen=True)
+
     activity: AttendanceActivity = Field(..., description="Activity data")
     formatted: ActivityListItem = Field(..., description="Formatted data for display")
 
 class ActivitiesListResponse(BaseModel):
     """API response for activities list"""
+    model_config = ConfigDict(frozen=True)
+
     activities: List[ActivityListItem] = Field(..., description="List of activities")
     pagination: "PaginationInfo" = Field(..., description="Pagination information")
     summary: ActivitySummary = Field(..., description="Summary statistics")
 
 class PaginationInfo(BaseModel):
     """Pagination information"""
+    model_config = ConfigDict(frozen=True)
+
     page: int = Field(..., description="Current page (0-based)")
     size: int = Field(..., description="Page size")
     total_items: int = Field(..., description="Total number of items")
@@ -73,12 +107,16 @@ class PaginationInfo(BaseModel):
 
 class ActivityStatsResponse(BaseModel):
     """API response for activity statistics"""
+    model_config = ConfigDict(frozen=True)
+
     summary: ActivitySummary = Field(..., description="Activity summary")
     recent_activities: List[ActivityListItem] = Field(..., description="Recent activities (last 7 days)")
     weekly_stats: List["WeeklyStats"] = Field(..., description="Weekly statistics")
 
 class WeeklyStats(BaseModel):
     """Weekly statistics"""
+    model_config = ConfigDict(frozen=True)
+
     week_start: str = Field(..., description="Week start date")
     week_end: str = Field(..., description="Week end date")
     days_completed: int = Field(..., description="Days with full attendance")
@@ -86,13 +124,11 @@ class WeeklyStats(BaseModel):
     days_missed: int = Field(..., description="Days with no attendance")
     success_rate: float = Field(..., description="Week success rate percentage")
 
-# Update forward references
-ActivitiesListResponse.model_rebuild()
-ActivityStatsResponse.model_rebuild()
-
 # Calendar view models
 class CalendarDay(BaseModel):
     """Calendar day representation"""
+    model_config = ConfigDict(frozen=True)
+
     date: str = Field(..., description="Date in YYYY-MM-DD format")
     day_number: int = Field(..., description="Day of month")
     is_current_month: bool = Field(..., description="Whether day is in current month")
@@ -106,6 +142,8 @@ class CalendarDay(BaseModel):
 
 class CalendarMonth(BaseModel):
     """Calendar month representation"""
+    model_config = ConfigDict(frozen=True)
+
     year: int = Field(..., description="Year")
     month: int = Field(..., description="Month (1-12)")
     month_name: str = Field(..., description="Month name")
@@ -114,11 +152,15 @@ class CalendarMonth(BaseModel):
 
 class MonthSummary(BaseModel):
     """Monthly summary"""
+    model_config = ConfigDict(frozen=True)
+
     total_working_days: int = Field(..., description="Total working days in month")
     attended_days: int = Field(..., description="Days with attendance")
     partial_days: int = Field(..., description="Days with partial attendance")
     missed_days: int = Field(..., description="Days missed")
     attendance_rate: float = Field(..., description="Attendance rate percentage")
 
-# Update forward references
+# Resolve forward references once, after every model is defined
+ActivitiesListResponse.model_rebuild()
+ActivityStatsResponse.model_rebuild()
 CalendarMonth.model_rebuild()
@@ -3,12 +3,14 @@ Pydantic models for system status data
 Based on the current_state.json structure from GreytHR
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 class ScriptInfo(BaseModel):
     """Script execution information"""
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Current script status")
     start_time: Optional[str] = Field(None, description="Script start time (ISO format)")
     pid: Optional[int] = Field(None, description="Process ID")
@@ -20,6 +22,8 @@ class ScriptInfo(BaseModel):
 
 class CurrentOperation(BaseModel):
     """Current operation information"""
+    model_config = ConfigDict(frozen=True)
+
     action: str = Field(..., description="Current action being performed")
     details: Optional[str] = Field(None, description="Operation details")
     start_time: Optional[str] = Field(None, description="Operation start time")
@@ -27,6 +31,8 @@ class CurrentOperation(BaseModel):
 
 class Configuration(BaseModel):
     """System configuration"""
+    model_config = ConfigDict(frozen=True)
+
     signin_time: Optional[str] = Field(None, description="Configured sign-in time")
     signout_time: Optional[str] = Field(None, description="Configured sign-out time")
     test_mode: Optional[bool] = Field(False, description="Test mode enabled")
@@ -36,6 +42,8 @@ class Configuration(BaseModel):
 
 class ScheduleInfo(BaseModel):
     """Schedule information"""
+    model_config = ConfigDict(frozen=True)
+
     next_signin: Optional[str] = Field(None, description="Next scheduled sign-in time")
     next_signout: Optional[str] = Field(None, description="Next scheduled sign-out time")
     daemon_running: Optional[bool] = Field(False, description="Daemon running status")
@@ -43,6 +51,8 @@ class ScheduleInfo(BaseModel):
 
 class TodaySummary(BaseModel):
     """Today's attendance summary"""
+    model_config = ConfigDict(frozen=True)
+
     date: Optional[str] = Field(None, description="Date (YYYY-MM-DD)")
     signin_status: Optional[str] = Field(None, description="Sign-in status description")
     signout_status: Optional[str] = Field(None, description="Sign-out status description")
@@ -59,6 +69,8 @@ class TodaySummary(BaseModel):
 
 class Statistics(BaseModel):
     """System statistics"""
+    model_config = ConfigDict(frozen=True)
+
     total_operations: Optional[int] = Field(0, description="Total operations performed")
     successful_operations: Optional[int] = Field(0, description="Successful operations")
     failed_operations: Optional[int] = Field(0, description="Failed operations")
@@ -70,18 +82,24 @@ class Statistics(BaseModel):
 
 class SystemResources(BaseModel):
     """System resource usage"""
+    model_config = ConfigDict(frozen=True)
+
     memory_usage_mb: Optional[float] = Field(0.0, description="Memory usage in MB")
     cpu_percent: Optional[float] = Field(0.0, description="CPU usage percentage")
     disk_usage_percent: Optional[float] = Field(0.0, description="Disk usage percentage")
 
 class ErrorInfo(BaseModel):
     """Error information"""
+    model_config = ConfigDict(frozen=True)
+
     last_error: Optional[str] = Field(None, description="Last error message")
     last_error_time: Optional[str] = Field(None, description="Last error timestamp")
     retry_info: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Retry information")
 
 class SystemStatus(BaseModel):
     """Complete system status model"""
+    model_config = ConfigDict(frozen=True)
+
     script: Optional[ScriptInfo] = Field(None, description="Script information")
     current_operation: Optional[CurrentOperation] = Field(None, description="Current operation")
     configuration: Optional[Configuration] = Field(None, description="System configuration")
@@ -95,6 +113,8 @@ class SystemStatus(BaseModel):
 # Response models for API endpoints
 class SystemStatusResponse(BaseModel):
     """API response for system status"""
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Overall system status")
     daemon_running: bool = Field(..., description="Whether daemon is running")
     uptime_seconds: int = Field(..., description="System uptime in seconds")
@@ -106,6 +126,8 @@ class SystemStatusResponse(BaseModel):
     
 class TodaySummaryResponse(BaseModel):
     """API response for today's summary"""
+    model_config = ConfigDict(frozen=True)
+
     date: str = Field(..., description="Date (YYYY-MM-DD)")
     signin_completed: bool = Field(..., description="Sign-in completed today")
     signout_completed: bool = Field(..., description="Sign-out completed today")
@@ -119,6 +141,8 @@ class TodaySummaryResponse(BaseModel):
 
 class HealthCheckResponse(BaseModel):
     """API response for health check"""
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Health status")
     checks: Dict[str, bool] = Field(..., description="Individual health checks")
     timestamp: str = Field(..., description="Health check timestamp")
@@ -0,0 +1,115 @@
+"""
+Response caching for GreytHR Web UI Dashboard
+Serves repeated GET polls from memory as ready-to-send bytes
+"""
+
+import hashlib
+import logging
+import time
+from types import MappingProxyType
+from typing import Callable, Coroutine, Any, Dict, NamedTuple, Optional
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+
+from .app_utils import TTLCache
+
+logger = logging.getLogger('webui.response_cache')
+
+# TTL in seconds per cache policy
+CACHE_POLICIES = MappingProxyType({"short": 5.0, "normal": 15.0, "long": 30.0})
+
+class CachedResponse(NamedTuple):
+    """Serialized response kept in the cache"""
+    body: bytes
+    headers: Dict[str, str]
+    generated_at: float
+
+# Shared by every CachedRoute, keyed by path + query string
+response_cache = TTLCache()
+
+# Last successful response per key, served when the endpoint fails
+_last_good: Dict[str, CachedResponse] = {}
+
+def cached(policy: str = "normal", stale_if_error: bool = False):
+    """Mark a route endpoint for response caching under a TTL policy"""
+    ttl = CACHE_POLICIES[policy]
+    
+    def decorator(endpoint):
+        endpoint.cache_ttl = ttl
+        endpoint.cache_stale_if_error = stale_if_error
+        return endpoint
+    
+    return decorator
+
+def _cache_key(request: Request) -> str:
+    """Get the cache key for a request"""
+    return f"{request.url.path}?{request.url.query}"
+
+def invalidate_responses(path_prefix: Optional[str] = None):
+    """Drop cached responses (all, or those whose path starts with path_prefix)"""
+    if path_prefix is None:
+        response_cache.invalidate()
+        return
+    for key in [key for key in response_cache.keys() if key.startswith(path_prefix)]:
+        response_cache.invalidate(key)
+
+def _not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """Get a 304 response when the client already holds this ETag"""
+    if etag and request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+def _replay(entry: CachedResponse, cache_status: str) -> Response:
+    """Rebuild a response from a cached entry"""
+    response = Response(content=entry.body, headers=entry.headers)
+    response.headers["X-Cache"] = cache_status
+    return response
+
+class CachedRoute(APIRoute):
+    """API route that serves GET responses of @cached endpoints from memory"""
+    
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        ttl = getattr(self.endpoint, "cache_ttl", None)
+        if ttl is None:
+            return handler
+        stale_if_error = getattr(self.endpoint, "cache_stale_if_error", False)
+        
+        async def cached_route_handler(request: Request) -> Response:
+            if request.method != "GET":
+                return await handler(request)
+            
+            key = _cache_key(request)
+            hit, entry = response_cache.get(key, ttl)
+            if not hit:
+                try:
+                    response = await handler(request)
+                except HTTPException as e:
+                    stale = _last_good.get(key) if stale_if_error else None
+                    if stale is None or e.status_code < 500:
+                        raise
+                    logger.warning(f"Serving stale response for {request.url.path}: {e.detail}")
+                    response = _replay(stale, "STALE")
+                    response.headers["Age"] = str(int(time.time() - stale.generated_at))
+                    return response
+                
+                body = getattr(response, "body", None)
+                # Only plain, successful responses are safe to replay
+                if response.status_code != status.HTTP_200_OK or body is None or response.background:
+                    return response
+                
+                # Let polling clients revalidate instead of re-downloading the body
+                if "etag" not in response.headers:
+                    response.headers["ETag"] = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+                response.headers.setdefault("Cache-Control", "no-cache")
+                
+                entry = CachedResponse(body, dict(response.headers), time.time())
+                response_cache.set(key, entry)
+                if stale_if_error:
+                    _last_good[key] = entry
+                return _not_modified(request, entry.headers["etag"]) or response
+            
+            return _not_modified(request, entry.headers.get("etag")) or _replay(entry, "HIT")
+        
+        return cached_route_handler
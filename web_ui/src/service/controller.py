@@ -3,27 +3,47 @@ Service management controller
 Business logic layer for service control operations
 """
 
+import asyncio
 import logging
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from .repository import ServiceRepository
 from .schemas import ServiceActionResponse, ServiceStatusResponse
+from ..app_utils import TTLCache
 
 logger = logging.getLogger('webui.service.controller')
 
+# How long a prerequisites check is reused before the files are checked again
+PREREQ_CACHE_TTL = 5.0
+
+# Message prefixes for successful actions
+_ACTION_PREFIX = MappingProxyType({
+    "start": "✅ Service started successfully. ",
+    "stop": "🛑 Service stopped successfully. ",
+    "restart": "🔄 Service restarted successfully. ",
+    "reset": "♻️ Service reset completed. ",
+})
+
 class ServiceController:
     """Controller for service management business logic"""
     
     def __init__(self, repository: ServiceRepository):
         self.repository = repository
+        self._prereq_cache = TTLCache(ttl=PREREQ_CACHE_TTL)
+        self._status_inflight: Optional[asyncio.Task] = None
+    
+    def invalidate_prereq_cache(self):
+        """Drop the cached prerequisites check so the next action re-checks the files"""
+        self._prereq_cache.invalidate()
     
     async def get_service_status(self) -> ServiceStatusResponse:
         """Get current service status with business logic validation"""
         try:
             logger.info("Getting service status")
-            status = await self.repository.get_service_status()
+            status = await self._shared_status()
             
             # Apply business logic enhancements
             enhanced_status = self._enhance_service_status(status)
@@ -58,7 +78,7 @@ class ServiceController:
             
             # Check if already running (unless forced)
             if not force:
-                current_status = await self.repository.get_service_status()
+                current_status = await self._shared_status()
                 if current_status.is_running:
                     return ServiceActionResponse(
                         success=False,
@@ -90,7 +110,7 @@ class ServiceController:
             
             # Check if already stopped (unless forced)
             if not force:
-                current_status = await self.repository.get_service_status()
+                current_status = await self._shared_status()
                 if not current_status.is_running:
                     return ServiceActionResponse(
                         success=True,
@@ -161,6 +181,7 @@ class ServiceController:
             
             # Execute reset action
             result = await self.repository.reset_service(confirm=confirm)
+            self.invalidate_prereq_cache()
             
             # Apply business logic enhancements
             enhanced_result = self._enhance_action_result(result, "reset")
@@ -177,19 +198,47 @@ class ServiceController:
     
     # Private helper methods for business logic
     
+    async def _shared_status(self) -> ServiceStatusResponse:
+        """Get the service status, sharing one in-flight lookup between concurrent callers"""
+        task = self._status_inflight
+        if task is None:
+            task = asyncio.ensure_future(self.repository.get_service_status())
+            task.add_done_callback(self._clear_status_inflight)
+            self._status_inflight = task
+        
+        # Shield so one caller's cancellation does not cancel the lookup for the others
+        return await asyncio.shield(task)
+    
+    def _clear_status_inflight(self, task: asyncio.Task):
+        """Free the in-flight slot once a status lookup finishes"""
+        if self._status_inflight is task:
+            self._status_inflight = None
+    
     async def _validate_service_prerequisites(self) -> Dict[str, Any]:
-        """Validate prerequisites for service operations"""
+        """Validate prerequisites for service operations (a passing check is reused for a few seconds)"""
+        prerequisites = await self._prereq_cache.get_or_load("prerequisites", self._check_service_prerequisites)
+        # Re-check after a failure so a just-fixed .env or script is picked up immediately
+        if not prerequisites.get('valid'):
+            self._prereq_cache.invalidate("prerequisites")
+        return prerequisites
+    
+    async def _check_service_prerequisites(self) -> Dict[str, Any]:
+        """Check the files service operations depend on"""
         try:
-            # Check if .env file exists
+            # Stat .env and the service script concurrently, off the event loop
             env_file = self.repository.project_path / ".env"
-            if not env_file.exists():
+            env_exists, script_exists = await asyncio.gather(
+                asyncio.to_thread(env_file.exists),
+                asyncio.to_thread(self.repository.service_script.exists)
+            )
+            
+            if not env_exists:
                 return {
                     'valid': False,
                     'message': '.env file not found. Create configuration first.'
                 }
             
-            # Check if service script exists
-            if not self.repository.service_script.exists():
+            if not script_exists:
                 return {
                     'valid': False,
                     'message': 'Service script not found. Check installation.'
@@ -211,14 +260,8 @@ class ServiceController:
     def _enhance_action_result(self, result: ServiceActionResponse, action: str) -> ServiceActionResponse:
         """Enhance action result with business logic"""
         # Add context-specific messaging
-        if result.success:
-            if action == "start":
-                result.message = f"✅ Service started successfully. {result.message}"
-            elif action == "stop":
-                result.message = f"🛑 Service stopped successfully. {result.message}"
-            elif action == "restart":
-                result.message = f"🔄 Service restarted successfully. {result.message}"
-            elif action == "reset":
-                result.message = f"♻️ Service reset completed. {result.message}"
+        prefix = _ACTION_PREFIX.get(action)
+        if result.success and prefix:
+            result.message = prefix + result.message
         
         return result
\ No newline at end of file
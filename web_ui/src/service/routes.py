@@ -4,6 +4,8 @@ FastAPI endpoints for service control operations
 """
 
 import logging
+from functools import lru_cache
+from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, status, Body
 from typing import Optional
 
@@ -19,13 +21,18 @@ logger = logging.getLogger('webui.service.routes')
 # Create router
 router = APIRouter(prefix="/api/service", tags=["service"])
 
+# One controller per project path, so its caches outlive a single request
+@lru_cache(maxsize=4)
+def _controller_for(project_path: Path) -> ServiceController:
+    """Get the shared service controller for a project path"""
+    return ServiceController(ServiceRepository(project_path))
+
 # Dependency to get service controller
 def get_service_controller(
     integration = Depends(get_greythr_integration_optional)
 ) -> ServiceController:
     """Get service controller with dependency injection"""
-    repository = ServiceRepository(integration.project_path)
-    return ServiceController(repository)
+    return _controller_for(integration.project_path)
 
 # Service status endpoints
 
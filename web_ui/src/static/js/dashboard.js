@@ -126,6 +126,15 @@ class GreytHRDashboard {
         }
     }
     
+    async requestServerRefresh() {
+        try {
+            // Drop server-side cached dashboard data so the next fetch is current
+            await fetch(`${this.apiBaseUrl}/dashboard/refresh`, { method: 'POST' });
+        } catch (error) {
+            console.error('Failed to request dashboard refresh:', error);
+        }
+    }
+    
     async fetchSystemStatus() {
         try {
             const response = await fetch(`${this.apiBaseUrl}/dashboard/status`);
@@ -220,6 +229,7 @@ class GreytHRDashboard {
             if (result.success) {
                 this.showSuccessToast(`Service started successfully! ${result.message}`);
                 // Refresh dashboard to show updated status
+                await this.requestServerRefresh();
                 await this.refreshDashboard();
             } else {
                 this.showErrorToast(`Failed to start service: ${result.message}`);
@@ -269,6 +279,7 @@ class GreytHRDashboard {
             if (result.success) {
                 this.showSuccessToast(`Service stopped successfully! ${result.message}`);
                 // Refresh dashboard to show updated status
+                await this.requestServerRefresh();
                 await this.refreshDashboard();
             } else {
                 this.showErrorToast(`Failed to stop service: ${result.message}`);
@@ -314,6 +325,7 @@ class GreytHRDashboard {
             if (result.success) {
                 this.showSuccessToast(`Service restart successful! ${result.message}`);
                 // Refresh dashboard to show updated status
+                await this.requestServerRefresh();
                 await this.refreshDashboard();
             } else {
                 this.showErrorToast(`Service restart failed: ${result.message}`);
@@ -0,0 +1,85 @@
+"""
+Tests for the dashboard repository
+"""
+
+import asyncio
+import json
+import os
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.dashboard.repository import DashboardRepository
+
+def write_activity(activities_dir: Path, day: date, signed_in: bool, signed_out: bool = True):
+    """Write a day's activity file the way the daemon does (temp file, then rename)"""
+    activities_dir.mkdir(parents=True, exist_ok=True)
+    data = {
+        "date": day.isoformat(),
+        "signin_completed": signed_in,
+        "signout_completed": signed_out,
+        "signin_time": f"{day.isoformat()}T09:00:00" if signed_in else None,
+        "signout_time": f"{day.isoformat()}T18:00:00" if signed_out else None,
+    }
+    tmp_path = activities_dir / "activity.tmp"
+    tmp_path.write_text(json.dumps(data))
+    os.replace(tmp_path, activities_dir / f"attendance_{day.isoformat()}.json")
+
+def past_days(count: int):
+    """The `count` days before today, oldest first"""
+    today = date.today()
+    return [today - timedelta(days=offset) for offset in range(count, 0, -1)]
+
+def test_quick_stats_count_past_days(tmp_path):
+    """Past days are aggregated into totals, streak and average times"""
+    activities_dir = tmp_path / "activities"
+    for day, signed_in in zip(past_days(4), (True, False, True, True)):
+        write_activity(activities_dir, day, signed_in)
+
+    stats = asyncio.run(DashboardRepository(tmp_path).get_quick_stats())
+
+    assert stats.total_days_tracked == 4
+    assert stats.success_rate == 75.0
+    assert stats.current_streak == 2
+    assert stats.last_7_days_success == 3
+    assert stats.avg_signout_time == "18:00"
+
+def test_quick_stats_pick_up_a_rewritten_past_day(tmp_path):
+    """Replacing a past day's file changes the stats on the next request"""
+    activities_dir = tmp_path / "activities"
+    days = past_days(3)
+    for day in days:
+        write_activity(activities_dir, day, True)
+    repository = DashboardRepository(tmp_path)
+    assert asyncio.run(repository.get_quick_stats()).current_streak == 3
+
+    write_activity(activities_dir, days[1], False)
+    stats = asyncio.run(repository.get_quick_stats())
+
+    assert stats.success_rate == 66.7
+    assert stats.current_streak == 1
+
+def test_quick_stats_pick_up_a_past_day_edited_in_place_after_invalidation(tmp_path):
+    """A file rewritten in place is re-read once the dashboard cache is dropped"""
+    activities_dir = tmp_path / "activities"
+    days = past_days(2)
+    for day in days:
+        write_activity(activities_dir, day, True)
+    repository = DashboardRepository(tmp_path)
+    asyncio.run(repository.get_quick_stats())
+
+    file_path = activities_dir / f"attendance_{days[0].isoformat()}.json"
+    data = json.loads(file_path.read_text())
+    data["signin_completed"] = False
+    file_path.write_text(json.dumps(data, indent=2))
+    repository.invalidate_rolling_stats()
+
+    assert asyncio.run(repository.get_quick_stats()).success_rate == 50.0
+
+def test_quick_stats_without_activity_files(tmp_path):
+    """No activity files gives empty stats rather than an error"""
+    (tmp_path / "activities").mkdir()
+
+    stats = asyncio.run(DashboardRepository(tmp_path).get_quick_stats())
+
+    assert stats.total_days_tracked == 0
+    assert stats.success_rate == 0.0
@@ -0,0 +1,34 @@
+"""
+Tests for the request validation dependencies
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from src.dependencies import validate_date_format, validate_log_filename
+
+@pytest.mark.parametrize("value", ["2024-01-31", "2024-02-29", "2023-12-01"])
+def test_valid_dates_pass(value):
+    """Real calendar dates are returned unchanged"""
+    assert validate_date_format(value) == value
+
+@pytest.mark.parametrize("value", ["2024-1-31", "20240131", "2024-01-31x", "", "yyyy-mm-dd"])
+def test_malformed_dates_are_rejected(value):
+    """Anything but zero-padded YYYY-MM-DD is a bad request"""
+    with pytest.raises(HTTPException) as error:
+        validate_date_format(value)
+    assert error.value.status_code == 400
+
+@pytest.mark.parametrize("value", ["2023-02-29", "2024-13-01", "2024-04-31", "2024-00-10", "0000-01-01"])
+def test_impossible_dates_are_rejected(value):
+    """Well-formed strings that are not calendar dates are rejected too"""
+    with pytest.raises(HTTPException) as error:
+        validate_date_format(value)
+    assert error.value.detail == "Invalid date value"
+
+def test_log_filename_must_be_an_allowed_log_file():
+    """Only *.log names with an allowed prefix and no path parts are accepted"""
+    assert validate_log_filename("webui_app.log") == "webui_app.log"
+    for value in ("webui_app.log.1", "webui_app.log~", "other.log", "webui_../x.log", "webui_a/b.log"):
+        with pytest.raises(HTTPException):
+            validate_log_filename(value)
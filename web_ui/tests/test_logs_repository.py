@@ -0,0 +1,133 @@
+"""
+Tests for the logs repository
+"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.logs.repository import LogsRepository
+
+START = datetime(2024, 1, 1, 8, 0, 0)
+
+def log_line(index: int, message: str = "message") -> str:
+    """Build a formatted log line `index` seconds after START"""
+    moment = START + timedelta(seconds=index)
+    return f"{moment:%Y-%m-%d %H:%M:%S},000 - INFO - module - {message} {index}"
+
+def write_log(logs_dir: Path, name: str, lines, mtime_index: int) -> Path:
+    """Write a log file whose mtime is `mtime_index` seconds after START"""
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    file_path = logs_dir / name
+    file_path.write_text("\n".join(lines) + "\n")
+    mtime = (START + timedelta(seconds=mtime_index)).timestamp()
+    os.utime(file_path, (mtime, mtime))
+    return file_path
+
+def recent_messages(repository: LogsRepository, limit: int, **filters):
+    """Get the messages of the recent logs, newest first"""
+    logs = asyncio.run(repository.get_recent_logs(limit, **filters))['logs']
+    return [log_entry['message'] for log_entry in logs]
+
+def test_blank_lines_do_not_shrink_the_newest_file(tmp_path):
+    """Blank lines in the newest file must not let older files fill the limit"""
+    older = [log_line(i) for i in range(600)]
+    newer = []
+    for i in range(1000, 1600):
+        newer.append(log_line(i))
+        if i % 7 == 0:
+            newer.append("")
+    write_log(tmp_path / "logs", "webui_old.log", older, 600)
+    write_log(tmp_path / "logs", "webui_new.log", newer, 1600)
+    repository = LogsRepository(tmp_path)
+
+    for limit in (50, 500):
+        expected = [f"message {i}" for i in range(1599, 1599 - limit, -1)]
+        assert recent_messages(repository, limit) == expected
+
+def test_unformatted_lines_sort_first_wherever_they_are(tmp_path):
+    """Traceback lines get the current time, so every one of them ranks first"""
+    lines = []
+    for i in range(400):
+        lines.append(log_line(i))
+        if i % 50 == 0:
+            lines += ["Traceback (most recent call last):", f"ValueError: bad {i}"]
+    write_log(tmp_path / "logs", "webui_app.log", lines, 400)
+    repository = LogsRepository(tmp_path)
+
+    tracebacks = []
+    for i in range(0, 400, 50):
+        tracebacks += ["Traceback (most recent call last):", f"ValueError: bad {i}"]
+    expected = tracebacks[::-1] + [f"message {i}" for i in range(399, 389, -1)]
+
+    assert recent_messages(repository, len(expected)) == expected
+
+    # Once the file is cached by a filtered read the result must not change
+    recent_messages(repository, 10, level="info")
+    assert recent_messages(repository, len(expected)) == expected
+
+def test_unformatted_lines_are_stamped_per_response(tmp_path):
+    """Lines without a timestamp report the time of the request, not of the first parse"""
+    write_log(tmp_path / "logs", "webui_app.log", [log_line(0), "Traceback (most recent call last):"], 0)
+    repository = LogsRepository(tmp_path)
+
+    first = asyncio.run(repository.get_recent_logs(0, level="info"))['logs']
+    first[1]['message'] = "changed by a caller"
+    second = asyncio.run(repository.get_recent_logs(0, level="info"))['logs']
+
+    assert second[0]['timestamp'] >= first[0]['timestamp'] > START.isoformat()
+    assert second[1]['message'] == "message 0"
+
+def test_cached_file_keeps_its_unterminated_last_line(tmp_path):
+    """A last line still being written is read again rather than dropped from the cache"""
+    logs_dir = tmp_path / "logs"
+    file_path = write_log(logs_dir, "webui_app.log", [log_line(0)], 10)
+    with open(file_path, "a") as f:
+        f.write(log_line(1))
+    repository = LogsRepository(tmp_path)
+
+    for _ in range(2):
+        assert recent_messages(repository, 0, level="info") == ["message 1", "message 0"]
+
+    with open(file_path, "a") as f:
+        f.write(" continued\n" + log_line(2) + "\n")
+    assert recent_messages(repository, 0, level="info") == ["message 2", "message 1 continued", "message 0"]
+
+def test_skipped_older_files_still_add_unformatted_lines(tmp_path):
+    """Files too old to add timestamped entries still contribute their tracebacks"""
+    write_log(tmp_path / "logs", "webui_old.log", [log_line(0), "Traceback (most recent call last):", log_line(1)], 1)
+    write_log(tmp_path / "logs", "webui_new.log", [log_line(i) for i in range(100, 200)], 200)
+    repository = LogsRepository(tmp_path)
+
+    expected = ["Traceback (most recent call last):"] + [f"message {i}" for i in range(199, 190, -1)]
+    assert recent_messages(repository, 10) == expected
+
+def test_today_filter_keeps_tracebacks_of_older_files(tmp_path):
+    """Unformatted lines count as logged today, even in a file from another day"""
+    write_log(tmp_path / "logs", "webui_old.log", [log_line(0), "Traceback (most recent call last):"], 1)
+    repository = LogsRepository(tmp_path)
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    assert recent_messages(repository, 10, date_filter=today) == ["Traceback (most recent call last):"]
+    assert recent_messages(repository, 10, date_filter=START.strftime("%Y-%m-%d")) == ["message 0"]
+
+def test_today_filter_finds_tracebacks_before_the_day(tmp_path):
+    """Unformatted lines ahead of today's part of a file are still logged today"""
+    today = datetime.now().replace(microsecond=0)
+    lines = ["Traceback (most recent call last):"] + [log_line(i) for i in range(5)]
+    lines.append(f"{today:%Y-%m-%d %H:%M:%S},000 - INFO - module - today")
+    write_log(tmp_path / "logs", "webui_app.log", lines, int((today - START).total_seconds()))
+    repository = LogsRepository(tmp_path)
+
+    assert recent_messages(repository, 10, date_filter=f"{today:%Y-%m-%d}") == ["Traceback (most recent call last):", "today"]
+
+def test_timestamps_going_backwards_match_a_full_sort(tmp_path):
+    """Files need not be in time order (clock changes, several writers)"""
+    order = [5, 1, 9, 0, 7, 3, 8, 2, 6, 4]
+    write_log(tmp_path / "logs", "webui_a.log", [log_line(i) for i in order], 20)
+    write_log(tmp_path / "logs", "webui_b.log", [log_line(i) for i in (15, 11, 12)], 10)
+    repository = LogsRepository(tmp_path)
+
+    assert recent_messages(repository, 4) == ["message 15", "message 12", "message 11", "message 9"]
+    assert recent_messages(repository, 2, date_filter=START.strftime("%Y-%m-%d")) == ["message 15", "message 12"]
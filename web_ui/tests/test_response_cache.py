@@ -0,0 +1,97 @@
+"""
+Tests for the response cache
+"""
+
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.response_cache import CachedRoute, _last_good, cached, invalidate_responses
+
+def make_client(stale_if_error: bool = False):
+    """Build a client for one cached endpoint whose body and failures the test controls"""
+    router = APIRouter(route_class=CachedRoute)
+    calls = {"count": 0, "body": {"value": 1}, "error": None}
+
+    @router.get("/data")
+    @cached("normal", stale_if_error=stale_if_error)
+    async def get_data():
+        calls["count"] += 1
+        if calls["error"]:
+            raise HTTPException(status_code=calls["error"], detail="failed")
+        return calls["body"]
+
+    app = FastAPI()
+    app.include_router(router)
+    invalidate_responses()
+    _last_good.clear()
+    return TestClient(app), calls
+
+def test_repeated_get_is_served_from_memory():
+    """A second GET replays the stored bytes without running the endpoint"""
+    client, calls = make_client()
+
+    first = client.get("/data")
+    second = client.get("/data")
+
+    assert first.json() == second.json() == {"value": 1}
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert calls["count"] == 1
+
+def test_matching_etag_gets_not_modified():
+    """Clients holding the current ETag get an empty 304, fresh or from the cache"""
+    client, calls = make_client()
+    etag = client.get("/data").headers["ETag"]
+
+    response = client.get("/data", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    invalidate_responses()
+    calls["body"] = {"value": 2}
+    response = client.get("/data", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+def test_invalidated_response_is_rebuilt():
+    """Dropping cached responses makes the next GET run the endpoint again"""
+    client, calls = make_client()
+    client.get("/data")
+
+    calls["body"] = {"value": 2}
+    invalidate_responses("/data")
+
+    assert client.get("/data").json() == {"value": 2}
+    assert calls["count"] == 2
+
+def test_server_error_serves_the_last_good_response():
+    """With stale_if_error a failing endpoint replays its last successful body"""
+    client, calls = make_client(stale_if_error=True)
+    client.get("/data")
+
+    invalidate_responses()
+    calls["error"] = 500
+    response = client.get("/data")
+
+    assert response.status_code == 200
+    assert response.json() == {"value": 1}
+    assert response.headers["X-Cache"] == "STALE"
+    assert "Age" in response.headers
+
+def test_client_errors_are_not_masked():
+    """Only server errors fall back to the stale response"""
+    client, calls = make_client(stale_if_error=True)
+    client.get("/data")
+
+    invalidate_responses()
+    calls["error"] = 404
+    assert client.get("/data").status_code == 404
+
+def test_without_stale_if_error_failures_propagate():
+    """Endpoints not marked stale_if_error report their failure"""
+    client, calls = make_client()
+    client.get("/data")
+
+    invalidate_responses()
+    calls["error"] = 500
+    assert client.get("/data").status_code == 500
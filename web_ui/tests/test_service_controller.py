@@ -0,0 +1,60 @@
+"""
+Tests for the service controller
+"""
+
+import asyncio
+
+from src.service.controller import ServiceController
+from src.service.repository import ServiceRepository
+
+def make_project(project_path):
+    """Create the files service operations depend on"""
+    (project_path / ".env").write_text("GREYTHR_URL=https://example.invalid\n")
+    (project_path / "greythr_service.sh").write_text("#!/bin/sh\n")
+
+def test_passing_prerequisites_check_is_reused(tmp_path):
+    """A passing check is not repeated within its TTL"""
+    make_project(tmp_path)
+    controller = ServiceController(ServiceRepository(tmp_path))
+
+    async def check_twice():
+        first = await controller._validate_service_prerequisites()
+        (tmp_path / ".env").unlink()
+        return first, await controller._validate_service_prerequisites()
+
+    first, second = asyncio.run(check_twice())
+    assert first['valid'] and second is first
+
+def test_failed_prerequisites_check_is_not_reused(tmp_path):
+    """Fixing a missing file is seen on the very next check"""
+    controller = ServiceController(ServiceRepository(tmp_path))
+
+    async def check_before_and_after_fix():
+        before = await controller._validate_service_prerequisites()
+        make_project(tmp_path)
+        return before, await controller._validate_service_prerequisites()
+
+    before, after = asyncio.run(check_before_and_after_fix())
+    assert not before['valid']
+    assert after['valid']
+
+def test_concurrent_status_requests_share_one_lookup(tmp_path):
+    """Callers arriving while a status lookup runs wait for it instead of starting their own"""
+    repository = ServiceRepository(tmp_path)
+    calls = []
+
+    async def slow_status():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "status"
+
+    repository.get_service_status = slow_status
+    controller = ServiceController(repository)
+
+    async def run():
+        shared = await asyncio.gather(*(controller._shared_status() for _ in range(5)))
+        return shared, await controller._shared_status()
+
+    shared, later = asyncio.run(run())
+    assert shared == ["status"] * 5 and later == "status"
+    assert len(calls) == 2